@@ -1,15 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
+import inspect
 import logging
 import os
+import reprlib
 import sys
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field, replace
+from difflib import get_close_matches
+from pathlib import Path
 from pprint import pformat
+from threading import RLock
+from time import perf_counter
+from types import MappingProxyType
 from typing import (
     Annotated,
+    Any,
+    Awaitable,
     Callable,
     Generator,
+    Hashable,
+    Iterable,
     Literal,
+    Mapping,
     Optional,
     Union,
     cast,
@@ -18,16 +34,43 @@ from typing import (
     get_type_hints,
     overload,
 )
+from weakref import WeakKeyDictionary
 
-__all__ = ["envotate"]
+__all__ = [
+    "aresolve",
+    "envotate",
+    "instantiate",
+    "origin",
+    "preload",
+    "reload",
+    "resolve_many",
+    "validate",
+]
 
 
-from envotate.errors import AnnotationError, VariableError
-from envotate.typing import AnnotatedArg, Class, Value, unpack_args
+from envotate import cache, casters
+from envotate.casters import FALSEY, INVALID, TRUTHY
+from envotate.errors import AnnotationError, Error, ValidationError, VariableError
+from envotate.hooks import Event, Hook
+from envotate.sources import Layered
+from envotate.trie import Trie
+from envotate.types import Items, cached_stats
+from envotate.typing import (
+    AnnotatedArg,
+    Class,
+    Dispatch,
+    Value,
+    call_apply,
+    get_dispatch,
+    unpack_args,
+)
 
-FALSEY = {"false", "no", "n", "0"}
-TRUTHY = {"true", "yes", "y", "1"}
+# The number of entries with annotated arguments or nested sections at which resolving
+# them on a thread pool is worth the overhead.
+PARALLEL_THRESHOLD = 4
 
+# The number of distinct values kept to be shared between the results of resolve_many.
+MEMO_SIZE = 10_000
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +82,14 @@ class Envotation:
     origin: Optional[type] = field(init=False)  # type: ignore[valid-type]
     args: list[type] = field(init=False, default_factory=list)  # type: ignore[valid-type]
     metadata: list[AnnotatedArg] = field(init=False, default_factory=list)
+    literals: Optional[frozenset[Value]] = field(init=False, default=None)
+    dispatch: tuple[type, ...] = field(  # type: ignore[valid-type]
+        init=False, default=()
+    )
+    collections: frozenset[Any] = field(init=False, default=frozenset())
+    container: Any = field(init=False, default=None)
+    items: tuple[type, ...] = field(init=False, default=())  # type: ignore[valid-type]
+    options: Items = field(init=False, default_factory=Items)
 
     def __post_init__(self) -> None:
         self.origin = get_origin(self.type)
@@ -53,19 +104,51 @@ class Envotation:
                     continue
                 if isinstance(arg, type):
                     arg = cast(AnnotatedArg, arg())
+                if isinstance(arg, Items):
+                    self.options = arg
+                    continue
                 self.metadata.append(arg)
 
         if self.origin in (Literal, Union, Annotated):
             self.args = unpack_args(self.type)
-        elif self.origin is not None:
+            try:
+                self.literals = frozenset(
+                    arg for arg in self.args if not isinstance(arg, type)
+                )
+            except TypeError:
+                self.literals = None
+            if get_origin(self.type) is Union:
+                # The types of a union are tried in the order they are declared. A
+                # collection (e.g. in `Optional[list[int]]`) is cast item by item.
+                members = [
+                    get_args(arg)[0] if get_origin(arg) is Annotated else arg
+                    for arg in get_args(self.type)
+                ]
+                self.collections = frozenset(
+                    arg
+                    for arg in members
+                    if (get_origin(arg) or arg) in casters.COLLECTIONS
+                )
+                self.dispatch = tuple(
+                    arg
+                    for arg in members
+                    if (isinstance(arg, type) or arg in self.collections)
+                    and arg is not type(None)
+                )
+        elif self.origin is not None and self.origin not in casters.COLLECTIONS:
             raise AnnotationError(
                 f"'{self.origin}' is not a supported type form.",
                 hint=(
                     "An origin may only be one of Literal, Union, Optional, "
-                    "or Annotated."
+                    "Annotated, list, tuple, set, frozenset, or dict."
                 ),
             )
 
+        container = get_origin(self.type) or self.type
+        if container in casters.COLLECTIONS:
+            self.container = container
+            self.items = get_args(self.type)
+
     # def __repr__(self) -> str:
     #     return pformat(self.dump())
 
@@ -87,115 +170,890 @@ class Envotation:
     def is_bool(self) -> bool:
         return self.type is bool
 
+    def is_literal_value(self, value: Value) -> bool:
+        if self.literals is not None:
+            try:
+                return value in self.literals
+            except TypeError:
+                pass
+
+        return value in self.args
+
     def cast(self, value: Value) -> Value:
-        try:
-            value = self.type(value)
-        except (TypeError, ValueError) as exc:
-            if self.args and self.type != self.args[-1]:
-                value = None
-            else:
-                raise AnnotationError(
-                    f"'{self.path} could not be cast to " f"{self.type.__qualname__}.",
-                    hint=str(exc),
-                )
+        """Convert a value to the type, or to the first type of a union that it can be
+        converted to, using the registered casters.
+        """
+        if self.container is not None:
+            return self.cast_collection(value)
+
+        if self.dispatch:
+            # A value that already has one of the types (e.g. a default) is kept.
+            if value.__class__ in self.dispatch:
+                return value
+            for arg in self.dispatch:
+                if arg in self.collections:
+                    result = self.cast_items(arg, value)
+                else:
+                    result = casters.cast(arg, value)
+                if result is not INVALID:
+                    return cast(Value, result)
+            names = ", ".join(getattr(arg, "__qualname__", "") for arg in self.dispatch)
+            raise AnnotationError(
+                f"'{self.path}' could not be cast to any of {names}.",
+                hint=f"The value was {value!r}.",
+            )
+
+        result = casters.cast(self.type, value)
+        if result is INVALID:
+            name = getattr(self.type, "__qualname__", repr(self.type))
+            raise AnnotationError(
+                f"'{self.path}' could not be cast to {name}.",
+                hint=f"The value was {value!r}.",
+            )
+
+        return cast(Value, result)
 
-        return value
+    def cast_collection(self, value: Value) -> Value:
+        options = self.options
+        if options.lazy and isinstance(value, str) and self.container is not dict:
+            item = self.items[0] if self.items else str
+            return casters.LazyItems(value, item, options.delimiter)  # type: ignore
+
+        result = self.cast_items(self.type, value)
+        if result is INVALID:
+            raise AnnotationError(
+                f"'{self.path}' could not be cast to {self.type}.",
+                hint=f"The value was {reprlib.repr(value)}.",
+            )
+
+        return cast(Value, result)
+
+    def cast_items(self, type_: Any, value: Value) -> Any:
+        """Convert a value to a collection type (e.g. `list[int]`), returning `INVALID`
+        if it cannot be converted.
+        """
+        options = self.options
+        return casters.cast_collection(
+            get_origin(type_) or type_,
+            get_args(type_),
+            value,
+            delimiter=options.delimiter,
+            separator=options.separator,
+            compact=options.compact,
+        )
 
     def dump(self) -> dict[str, Union[Value, type]]:  # type: ignore[valid-type]
         return asdict(self)
 
 
+def snapshot(environ: Optional[Mapping[str, str]] = None) -> Mapping[str, str]:
+    """Return an immutable copy of an environment mapping (`os.environ` by default) so
+    that a single resolution reads one consistent view of it.
+    """
+    if isinstance(environ, (MappingProxyType, Layered)):
+        return environ
+
+    return MappingProxyType(dict(os.environ if environ is None else environ))
+
+
+@dataclass
+class Entry:
+    """A compiled lookup for a single attribute of a settings class."""
+
+    attribute: str
+    path: str
+    key: str
+    context: type
+    envotation: Optional[Envotation] = None
+    section: Optional[type] = None
+
+    @property
+    def is_contextual(self) -> bool:
+        """Whether an annotated argument receives the class as context (e.g. `Method`)
+        and may therefore read the other attributes of the class.
+        """
+        if self.envotation is None:
+            return False
+
+        return any(
+            Dispatch.CONTEXT in get_dispatch(arg.apply)
+            for arg in self.envotation.metadata
+        )
+
+
+@dataclass
+class Plan:
+    """The compiled entries for a settings class, in resolution order.
+
+    Plans are stored on the class that they belong to, because the entries refer to it
+    and would otherwise keep it alive.
+    """
+
+    cls: type
+    entries: list[Entry]
+
+
+def section_target(section: type) -> type:
+    """Return the class that a nested section is resolved onto: the section itself the
+    first time, and then a subclass with the original defaults, so that each prefix has
+    a distinct result.
+    """
+    if "__envotations__" in vars(section):
+        state: Optional[State] = vars(section).get("__envotate_state__")
+        namespace = dict(state.defaults) if state is not None else {}
+        namespace.update(
+            __module__=section.__module__, __qualname__=section.__qualname__
+        )
+        section = type(section.__name__, (section,), namespace)
+    section.__envotations__ = set()  # type: ignore[attr-defined]
+
+    return section
+
+
+def populate(section: type, values: Iterable[tuple[str, object]]) -> type:
+    """Set the resolved values of a nested section on the class returned by
+    `section_target()`.
+    """
+    for attribute, value in values:
+        setattr(section, attribute, value)
+        section.__envotations__.add(attribute)  # type: ignore[attr-defined]
+
+    return section
+
+
+@dataclass
+class Tree:
+    """The resolved values of a settings class and its nested sections, as persisted
+    to the cache directory.
+    """
+
+    values: dict[str, Union[Value, Tree]]
+
+
 @dataclass
 class Resolver:
     prefix: Optional[str]
     aliases: Optional[dict[str, str]]
     export: Optional[set[str]]
+    cache_dir: Optional[Union[str, Path]] = None
+    hook: Optional[Hook] = None
+    workers: Optional[int] = None
+
+    def compile(self, cls: type[Class], path: Optional[str] = None) -> Plan:
+        """Return the plan for a class, analyzing the annotations only once for each
+        combination of path, prefix, and aliases.
+        """
+        options = (path, self.prefix, tuple(sorted((self.aliases or {}).items())))
+        compiled: Optional[dict[Hashable, Plan]] = vars(cls).get("__envotate_plans__")
+        if compiled is None:
+            compiled = {}
+            cls.__envotate_plans__ = compiled  # type: ignore[attr-defined]
+        elif options in compiled:
+            return compiled[options]
+
+        plan, digest = None, None
+        name = f"{cls.__module__}.{cls.__qualname__}"
+        if self.cache_dir is not None:
+            modules = (base.__module__ for base in cls.__mro__ if base is not object)
+            digest = cache.source_hash(modules, cls.__qualname__, options)
+            if digest:
+                entries = cache.load(self.cache_dir, name, digest)
+                if isinstance(entries, list):
+                    plan = Plan(cls, [replace(e, context=cls) for e in entries])
+
+        if plan is None:
+            plan = Plan(cls, list(self.analyze(cls, path)))
+            if self.cache_dir is not None and digest:
+                # A class is not yet bound in its module while it is being decorated,
+                # so the entries are persisted without it and bound again when loaded.
+                unbound = cast(type, None)
+                unbound_entries = [replace(e, context=unbound) for e in plan.entries]
+                # An annotation may use an alias imported from another module.
+                imported: set[str] = set()
+                for base in cls.__mro__:
+                    annotations = vars(base).get("__annotations__", {}).values()
+                    imported |= cache.find_modules(base.__module__, annotations)
+                cache.dump(self.cache_dir, name, digest, unbound_entries, imported)
+
+        compiled[options] = plan
+
+        return plan
+
+    def analyze(
+        self,
+        cls: type[Class],
+        path: Optional[str] = None,
+    ) -> Generator[Entry, None, None]:
+        # The hints for a class include the annotations of every base in its MRO.
+        for attribute, annotation in get_type_hints(cls, include_extras=True).items():
+            entry_path = f"{path}.{attribute}" if path is not None else attribute
+            key = attribute
+            if self.aliases and entry_path in self.aliases:
+                key = self.aliases[entry_path]
+            if self.prefix:
+                key = f"{self.prefix}_{key}"
+
+            entry = Entry(attribute, entry_path, key, context=cls)
+            if hasattr(annotation, "__envotations__") or getattr(
+                annotation, "__annotations__", None
+            ):
+                entry.section = annotation
+            else:
+                entry.envotation = Envotation(annotation, entry_path)
+
+            yield entry
+
+    def track(
+        self,
+        cls: type[Class],
+        path: Optional[str],
+        environ: Mapping[str, str],
+        lock: Optional[RLock] = None,
+        sections: Optional[dict[Hashable, type]] = None,
+    ) -> State:
+        """Attach the state used to reload a class resolved by this resolver, sharing
+        the nested sections resolved so far with the rest of the class tree.
+        """
+        state = State(self, path, environ, lock=lock or RLock())
+        if sections is not None:
+            state.sections = sections
+        cls.__envotate_state__ = state  # type: ignore[attr-defined]
+
+        return state
 
     def resolve(
         self,
         cls: type[Class],
         path: Optional[str] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        sections: Optional[dict[Hashable, type]] = None,
     ) -> Generator[tuple[str, Union[Value, type]], None, None]:
-        seen = set()
-        for base in cls.__mro__:
-            if not base or base is object:
+        environ = snapshot(environ)
+        state = self.track(cls, path, environ, sections=sections)
+        entries = self.compile(cls, path).entries
+        defaults, inherited = self.overlay(cls, entries, environ)
+        for entry in entries:
+            if entry.section is None:
+                state.defaults[entry.attribute] = defaults.get(
+                    entry.attribute, getattr(cls, entry.attribute, None)
+                )
+
+        if inherited:
+            yield from inherited.items()
+            entries = [entry for entry in entries if entry.attribute not in inherited]
+
+        if self.workers and self.is_parallel(entries):
+            yield from self.resolve_parallel(entries, cls, state)
+            return
+
+        for entry in entries:
+            if entry.section is None:
+                default = state.defaults[entry.attribute]
+                yield entry.attribute, self.get(entry, default, environ)
+            else:
+                yield entry.attribute, self.section(entry, cls, environ)
+
+    def overlay(
+        self,
+        cls: type,
+        entries: list[Entry],
+        environ: Mapping[str, str],
+    ) -> tuple[dict[str, Value], dict[str, Value]]:
+        """Return the original defaults and the resolved values that a class inherits
+        from its nearest decorated base, so that a subclass (e.g. a profile) only
+        resolves the attributes that it adds or overrides.
+
+        A value is only inherited if the base resolved it from the same key and
+        environment value, without receiving the class as context.
+        """
+        defaults: dict[str, Value] = {}
+        inherited: dict[str, Value] = {}
+        overrides: set[str] = set()
+        for base in cls.__mro__[1:]:
+            state: Optional[State] = vars(base).get("__envotate_state__")
+            if state is not None and state.path is None:
+                break
+            overrides.update(vars(base), vars(base).get("__annotations__", {}))
+        else:
+            return defaults, inherited
+
+        overrides.update(vars(cls), vars(cls).get("__annotations__", {}))
+        resolved: set[str] = vars(base).get("__envotations__", set())
+        keys = {
+            entry.attribute: entry.key
+            for entry in state.resolver.compile(base, None).entries
+        }
+        for entry in entries:
+            attribute = entry.attribute
+            if entry.section is not None or attribute in overrides:
                 continue
-            for attribute, annotation in get_type_hints(
-                base,
-                include_extras=True,
-            ).items():
-                if attribute in seen:
-                    continue
-                seen.add(attribute)
+            if attribute in state.defaults:
+                defaults[attribute] = state.defaults[attribute]
+            value = vars(base).get(attribute)
+            if (
+                attribute in resolved
+                and keys.get(attribute) == entry.key
+                and environ.get(entry.key) == state.environ.get(entry.key)
+                and not isinstance(value, LazyAttribute)
+                and not entry.is_contextual
+            ):
+                inherited[attribute] = value
+
+        return defaults, inherited
+
+    def scope(
+        self,
+        section: type,
+        cls: type,
+    ) -> tuple[Resolver, Optional[str], Hashable]:
+        """Return the resolver and path for a nested section of a class, and the key
+        that its result is shared under.
+
+        A section decorated with a prefix of its own is resolved with it appended to
+        this prefix (e.g. `REPLICA_DB`), and any other section with this prefix.
+        """
+        resolver: Resolver = self
+        path: Optional[str] = cls.__qualname__
+        state: Optional[State] = vars(section).get("__envotate_state__")
+        if state is not None and state.path is None:
+            resolver, path = state.resolver, None
+            prefix = "_".join(part for part in (self.prefix, resolver.prefix) if part)
+            if prefix != (resolver.prefix or ""):
+                resolver = replace(
+                    resolver,
+                    prefix=prefix,
+                    export=None,
+                    hook=self.hook,
+                    workers=self.workers,
+                )
+        return resolver, path, resolver.section_key(path)
+
+    def section_key(self, path: Optional[str]) -> Hashable:
+        aliases = tuple(sorted((self.aliases or {}).items()))
+        # Aliases are matched against the path of an attribute, so only then does the
+        # path change the keys.
+        return (self.prefix or None, aliases, path if aliases else None)
+
+    def nested(
+        self,
+        section: type,
+        cls: type,
+        environ: Mapping[str, str],
+    ) -> tuple[Resolver, Optional[str], dict[Hashable, type], Hashable]:
+        """Return the resolver and path for a nested section of a class that is being
+        resolved, with the sections already resolved from the same environment and the
+        key of its result among them.
+
+        A section decorated with the same prefix (and aliases) from an equal environment
+        is its own result.
+        """
+        resolver, path, scope = self.scope(section, cls)
+        state: State = vars(cls)["__envotate_state__"]
+        key = (section, scope)
+        if key not in state.sections:
+            own: Optional[State] = vars(section).get("__envotate_state__")
+            if (
+                own is not None
+                and own.resolver is resolver
+                and (own.environ is environ or dict(own.environ) == dict(environ))
+            ):
+                state.sections[key] = section
+
+        return resolver, path, state.sections, key
+
+    def section(self, entry: Entry, cls: type, environ: Mapping[str, str]) -> type:
+        section = cast(type, entry.section)
+        resolver, path, resolved, key = self.nested(section, cls, environ)
+        if key in resolved:
+            return resolved[key]
 
-                if hasattr(annotation, "__envotations__"):
-                    yield attribute, annotation
-                elif getattr(annotation, "__annotations__", None):
-                    annotation.__envotations__ = set()
-                    for _attr, _val in self.resolve(annotation, path=base.__qualname__):
-                        setattr(annotation, _attr, _val)
-                        annotation.__envotations__.add(_attr)
-                    yield attribute, annotation
+        if self.hook is not None:
+            start = perf_counter()
+        target = section_target(section)
+        populate(target, resolver.resolve(target, path, environ, resolved))
+        if self.hook is not None:
+            duration = perf_counter() - start
+            name = section.__qualname__
+            self.hook(Event("section", entry.path, entry.key, duration, name))
 
+        return resolved.setdefault(key, target)
+
+    def is_parallel(self, entries: list[Entry]) -> bool:
+        """Whether enough entries might block on I/O (nested sections or annotated
+        arguments) for a thread pool to help.
+        """
+        count = 0
+        for entry in entries:
+            if entry.section is not None or (
+                entry.envotation is not None and entry.envotation.metadata
+            ):
+                count += 1
+                if count >= PARALLEL_THRESHOLD:
+                    return True
+
+        return False
+
+    def resolve_parallel(
+        self,
+        entries: list[Entry],
+        cls: type,
+        state: State,
+    ) -> Generator[tuple[str, Union[Value, type]], None, None]:
+        """Resolve the entries that might block on I/O on a thread pool, yielding the
+        results in declaration order.
+
+        Entries that receive the class as context are resolved in order once the
+        preceding attributes have been yielded (and set on the class), as they would be
+        sequentially. Nested sections are resolved sequentially within a worker.
+        """
+        environ = state.environ
+        futures: dict[str, Future[Union[Value, type]]] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for entry in entries:
+                # Each task runs in a copy of the context to share e.g. the stat cache.
+                run = contextvars.copy_context().run
+                if entry.section is not None:
+                    futures[entry.attribute] = executor.submit(
+                        run, self.section, entry, cls, environ
+                    )
+                elif entry.envotation and entry.envotation.metadata:
+                    if not entry.is_contextual:
+                        default = state.defaults[entry.attribute]
+                        futures[entry.attribute] = executor.submit(
+                            run, self.get, entry, default, environ
+                        )
+
+            for entry in entries:
+                if entry.attribute in futures:
+                    yield entry.attribute, futures[entry.attribute].result()
                 else:
-                    yield attribute, self.get(
-                        cls=base,
-                        path=path,
-                        attribute=attribute,
-                        annotation=annotation,
+                    default = state.defaults[entry.attribute]
+                    yield entry.attribute, self.get(entry, default, environ)
+
+    def cached(
+        self,
+        cls: type[Class],
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> Generator[tuple[str, Union[Value, type]], None, None]:
+        """Restore the resolved values for a class tree from the cache directory, or
+        resolve them and write them to it.
+
+        The values are keyed by a hash of the module sources, the options, and the
+        environment value for every key in the tree, so a change to any of them falls
+        back to normal resolution.
+        """
+        environ = snapshot(environ)
+        name = f"{cls.__module__}.{cls.__qualname__}.values"
+        cache_dir = self.cache_dir
+        digest = self.digest(cls, environ) if cache_dir is not None else None
+        tree = cache.load(cache_dir, name, digest) if cache_dir and digest else None
+        if isinstance(tree, Tree):
+            yield from self.restore(cls, None, environ, tree)
+            return
+
+        yield from self.resolve(cls, environ=environ)
+        if cache_dir and digest:
+            cache.dump(cache_dir, name, digest, self.freeze(cls))
+
+    def keys(self, cls: type, path: Optional[str] = None) -> Generator[str, None, None]:
+        """Yield the environment key of every attribute in a class tree."""
+        for entry in self.compile(cls, path).entries:
+            if entry.section is not None:
+                resolver, section_path, _ = self.scope(entry.section, cls)
+                yield from resolver.keys(entry.section, section_path)
+            else:
+                yield entry.key
+
+    def unknown(
+        self,
+        cls: type,
+        environ: Mapping[str, str],
+    ) -> list[tuple[str, str, Error]]:
+        """Return an error for each variable under the prefix that does not match the
+        key of any attribute in the class tree, suggesting the nearest key.
+        """
+        if not self.prefix:
+            raise ValueError("A prefix is required to find unknown variables.")
+
+        known = set(self.keys(cls))
+        errors: list[tuple[str, str, Error]] = []
+        for key in sorted(Trie(environ).find(self.prefix)):
+            if key in known:
+                continue
+            matches = get_close_matches(key, known, n=1)
+            hint = f"did you mean '{matches[0]}'?" if matches else ""
+            error = VariableError(f"'{key}' does not match any attribute.", hint=hint)
+            errors.append((cls.__qualname__, key, error))
+
+        return errors
+
+    def digest(self, cls: type, environ: Mapping[str, str]) -> Optional[str]:
+        modules: list[str] = []
+        inputs: list[tuple[str, Optional[str]]] = []
+
+        def visit(resolver: Resolver, cls: type, path: Optional[str]) -> None:
+            modules.extend(
+                base.__module__ for base in cls.__mro__ if base is not object
+            )
+            for entry in resolver.compile(cls, path).entries:
+                if entry.section is not None:
+                    section_resolver, section_path, _ = resolver.scope(
+                        entry.section, cls
                     )
+                    visit(section_resolver, entry.section, section_path)
+                else:
+                    inputs.append((entry.key, environ.get(entry.key)))
 
-    def get(
+        visit(self, cls, None)
+        aliases = tuple(sorted((self.aliases or {}).items()))
+
+        return cache.source_hash(
+            modules, cls.__qualname__, self.prefix, aliases, inputs
+        )
+
+    def freeze(self, cls: type, path: Optional[str] = None) -> Tree:
+        values: dict[str, Union[Value, Tree]] = {}
+        for entry in self.compile(cls, path).entries:
+            if entry.section is not None:
+                resolver, section_path, _ = self.scope(entry.section, cls)
+                section = getattr(cls, entry.attribute)
+                values[entry.attribute] = resolver.freeze(section, section_path)
+            else:
+                values[entry.attribute] = getattr(cls, entry.attribute)
+
+        return Tree(values)
+
+    def restore(
+        self,
+        cls: type[Class],
+        path: Optional[str],
+        environ: Mapping[str, str],
+        tree: Tree,
+        sections: Optional[dict[Hashable, type]] = None,
+    ) -> Generator[tuple[str, Union[Value, type]], None, None]:
+        state = self.track(cls, path, environ, sections=sections)
+        for entry in self.compile(cls, path).entries:
+            value = tree.values[entry.attribute]
+            section = entry.section
+            if section is None:
+                state.defaults[entry.attribute] = getattr(cls, entry.attribute, None)
+                yield entry.attribute, cast(Value, value)
+                continue
+
+            resolver, section_path, resolved, key = self.nested(section, cls, environ)
+            if key not in resolved:
+                target = section_target(section)
+                values = resolver.restore(
+                    target, section_path, environ, cast(Tree, value), resolved
+                )
+                resolved.setdefault(key, populate(target, values))
+            yield entry.attribute, resolved[key]
+
+    def defer(
         self,
-        *,
         cls: type[Class],
-        attribute: str,
-        annotation: type,
         path: Optional[str] = None,
-    ) -> Value:
-        name = attribute
-        path = f"{path}.{name}" if path is not None else attribute
-        envotation = Envotation(annotation, path)
-
-        if self.aliases and path in self.aliases:
-            name = self.aliases[path]
-        if self.prefix:
-            name = f"{self.prefix}_{name}"
-
-        # FIXME: Optional type vs. check for default vs. needs to exist in env, etc.
-        value = os.environ.get(name, getattr(cls, attribute, None))
-        if value is None:
-            if not envotation.is_optional:
-                raise VariableError(
-                    f"'{path}' is required but missing from the environment and has "
-                    "not set a default."
+        environ: Optional[Mapping[str, str]] = None,
+        lock: Optional[RLock] = None,
+        sections: Optional[dict[Hashable, type]] = None,
+    ) -> Generator[tuple[str, LazyAttribute], None, None]:
+        """Yield a descriptor for each attribute that resolves it on first access
+        using the environment as it was when deferred.
+        """
+        state = self.track(cls, path, snapshot(environ), lock, sections)
+        for entry in self.compile(cls, path).entries:
+            if entry.section is None:
+                state.defaults[entry.attribute] = getattr(cls, entry.attribute, None)
+            yield entry.attribute, LazyAttribute(entry, cls, state)
+
+    def validate(
+        self,
+        cls: type[Class],
+        path: Optional[str] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        errors: Optional[list[tuple[str, str, Error]]] = None,
+        memo: Optional[dict[tuple[str, str, Optional[str]], Value]] = None,
+    ) -> type[Class]:
+        """Resolve a class tree onto a throwaway subclass that is returned, appending
+        every error to `errors` instead of raising the first one.
+
+        If a `memo` is given, the value for each attribute that does not receive the
+        class as context is stored in it and reused whenever the same environment value
+        is resolved again.
+        """
+        environ = snapshot(environ)
+        errors = [] if errors is None else errors
+        # Values are set on a subclass so that `Method` and `Function` arguments see
+        # the resolved attributes without the class itself being modified.
+        shadow = type(
+            cls.__name__,
+            (cls,),
+            {"__module__": cls.__module__, "__qualname__": cls.__qualname__},
+        )
+        try:
+            entries = self.compile(cls, path).entries
+        except Error as exc:
+            errors.append((cls.__qualname__, "", exc))
+            return shadow
+
+        state: Optional[State] = vars(cls).get("__envotate_state__")
+        for entry in entries:
+            section = entry.section
+            if section is not None:
+                resolver, section_path, _ = self.scope(section, cls)
+                section = resolver.validate(
+                    section, section_path, environ, errors, memo
                 )
-            return value
+                setattr(shadow, entry.attribute, section)
+                continue
+
+            if state is not None and entry.attribute in state.defaults:
+                default = state.defaults[entry.attribute]
+            else:
+                default = getattr(cls, entry.attribute, None)
+            memo_key = None
+            if memo is not None and not entry.is_contextual:
+                memo_key = (entry.path, entry.key, environ.get(entry.key))
+                if memo_key in memo:
+                    setattr(shadow, entry.attribute, memo[memo_key])
+                    continue
+            try:
+                value = self.get(replace(entry, context=shadow), default, environ)
+            except Error as exc:
+                errors.append((entry.path, entry.key, exc))
+            except Exception as exc:
+                # e.g. a `Method` that reads an attribute which failed to resolve.
+                error = VariableError(
+                    f"'{entry.path}' could not be evaluated.", hint=repr(exc)
+                )
+                errors.append((entry.path, entry.key, error))
+            else:
+                setattr(shadow, entry.attribute, value)
+                if memo_key is not None:
+                    memo[memo_key] = value  # type: ignore[index]
+
+        return shadow
+
+    def record(
+        self,
+        cls: type,
+        shadow: type,
+        path: Optional[str] = None,
+        interned: Optional[dict[Record, Record]] = None,
+    ) -> Record:
+        """Copy the values resolved onto a shadow class tree into frozen records.
+
+        If `interned` is given, a nested record equal to one already in it is replaced
+        by the existing record so that identical sections share a single instance.
+        """
+        values = {}
+        for entry in self.compile(cls, path).entries:
+            value = getattr(shadow, entry.attribute)
+            if entry.section is not None:
+                resolver, section_path, _ = self.scope(entry.section, cls)
+                value = resolver.record(entry.section, value, section_path, interned)
+                if interned is not None:
+                    try:
+                        value = interned.setdefault(value, value)
+                    except TypeError:
+                        pass  # e.g. a record with a list value is not hashable.
+            values[entry.attribute] = value
+
+        return record_type(cls)(**values)
+
+    def get(
+        self,
+        entry: Entry,
+        default: Value = None,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> Value:
+        steps = self.steps(entry, default, environ)
+        try:
+            value = next(steps)
+            while True:
+                if inspect.isawaitable(value):
+                    # e.g. an `async def` function, which is never awaited here.
+                    getattr(value, "close", lambda: None)()
+                    error = VariableError(
+                        f"'{entry.path}' returned an awaitable.",
+                        hint="Use `await aresolve(...)` to resolve async arguments.",
+                    )
+                    value = steps.throw(error)
+                    continue
+                value = steps.send(value)
+        except StopIteration as stop:
+            return cast(Value, stop.value)
+
+    def steps(
+        self,
+        entry: Entry,
+        default: Value = None,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> Generator[Value, Value, Value]:
+        """Look up, apply the annotated arguments to, and convert the value of an
+        attribute, returning the result.
+
+        The result of a callable default and of each argument is yielded, and the
+        value sent back is used in its place, so that `aget()` can await them. An
+        error thrown back is raised as if from the callable or argument.
+        """
+        envotation = cast(Envotation, entry.envotation)
+        cls = entry.context
+        path = entry.path
+        hook = self.hook
+        if environ is None:
+            environ = os.environ
 
-        if callable(value):
-            value = value()
+        # The hook checks are kept inline so that resolution without a hook only pays
+        # for a few comparisons.
+        if hook is not None:
+            begin = start = perf_counter()
+        try:
+            # FIXME: Optional type vs. check for default vs. needs to exist in env.
+            value = environ.get(entry.key, default)
+            if hook is not None:
+                hook(Event("lookup", path, entry.key, perf_counter() - start))
+
+            if value is None:
+                if not envotation.is_optional:
+                    raise VariableError(
+                        f"'{path}' is required but missing from the environment and "
+                        "has not set a default."
+                    )
+                return value
+
+            if callable(value):
+                value = yield value()
 
-        if envotation.metadata:
             for arg in envotation.metadata:
+                if hook is not None:
+                    start = perf_counter()
                 try:
-                    params = get_type_hints(arg.apply)
-                    if "value" not in params and "context" not in params:
-                        value = arg.apply()  # type: ignore[assignment]
-                    elif "value" in params and "context" in params:
-                        value = arg.apply(value, cls)  # type: ignore[assignment]
-                    elif "value" in params:
-                        value = arg.apply(value)  # type: ignore[assignment]
-                    else:
-                        value = arg.apply(cls)  # type: ignore[assignment]
+                    value = yield call_apply(arg.apply, value, cls)
                 except (TypeError, ValueError) as exc:
                     arg_path = arg.__class__.__qualname__
                     raise VariableError(
                         f"'{path}' could not be evaluated for '{arg_path}'.",
                         hint=str(exc),
                     )
+                finally:
+                    if hook is not None:
+                        duration = perf_counter() - start
+                        arg_name = arg.__class__.__qualname__
+                        hook(Event("apply", path, entry.key, duration, arg_name))
+
+            if hook is None:
+                return self.convert(envotation, value, path)
+
+            start = perf_counter()
+            try:
+                return self.convert(envotation, value, path)
+            finally:
+                hook(Event("cast", path, entry.key, perf_counter() - start))
+        finally:
+            if hook is not None:
+                duration = perf_counter() - begin
+                hook(Event("attribute", path, entry.key, duration))
+
+    async def aresolve(
+        self,
+        cls: type[Class],
+        path: Optional[str] = None,
+        environ: Optional[Mapping[str, str]] = None,
+        sections: Optional[dict[Hashable, type]] = None,
+    ) -> list[tuple[str, Union[Value, type]]]:
+        """Resolve the attributes of a class concurrently, awaiting any annotated
+        arguments that return awaitables.
+
+        Attributes (and nested sections) whose arguments do not receive the class as
+        context are resolved together first and set on the class. Those that do (e.g.
+        `Method`) may read other attributes, so they are then resolved in order.
+        """
+        environ = snapshot(environ)
+        state = self.track(cls, path, environ, sections=sections)
+        entries = self.compile(cls, path).entries
+        independent, dependent = [], []
+        for entry in entries:
+            if entry.section is None:
+                state.defaults[entry.attribute] = getattr(cls, entry.attribute, None)
+            if entry.is_contextual:
+                dependent.append(entry)
+            else:
+                independent.append(entry)
+
+        awaitables: list[Awaitable[Union[Value, type]]] = []
+        for entry in independent:
+            if entry.section is not None:
+                awaitables.append(self.asection(entry, cls, environ))
+            else:
+                default = state.defaults[entry.attribute]
+                awaitables.append(self.aget(entry, default, environ))
+
+        values: dict[str, Union[Value, type]] = {}
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+        # The first error in declaration order is raised once every task is done.
+        for entry, result in zip(independent, results):
+            if isinstance(result, BaseException):
+                raise result
+            values[entry.attribute] = result
+            setattr(cls, entry.attribute, result)
+
+        for entry in dependent:
+            default = state.defaults[entry.attribute]
+            values[entry.attribute] = await self.aget(entry, default, environ)
+            setattr(cls, entry.attribute, values[entry.attribute])
+
+        return [(entry.attribute, values[entry.attribute]) for entry in entries]
+
+    async def asection(
+        self,
+        entry: Entry,
+        cls: type,
+        environ: Mapping[str, str],
+    ) -> type:
+        section = cast(type, entry.section)
+        resolver, path, resolved, key = self.nested(section, cls, environ)
+        if key in resolved:
+            return resolved[key]
+
+        if self.hook is not None:
+            start = perf_counter()
+        target = section_target(section)
+        populate(target, await resolver.aresolve(target, path, environ, resolved))
+        if self.hook is not None:
+            duration = perf_counter() - start
+            name = section.__qualname__
+            self.hook(Event("section", entry.path, entry.key, duration, name))
+
+        return resolved.setdefault(key, target)
 
-        if envotation.is_bool and not isinstance(value, bool):
-            if str(value).strip().lower() not in TRUTHY | FALSEY:
+    async def aget(
+        self,
+        entry: Entry,
+        default: Value = None,
+        environ: Optional[Mapping[str, str]] = None,
+    ) -> Value:
+        """The same as `get()`, except that awaitable results of callable defaults and
+        annotated arguments are awaited.
+        """
+        steps = self.steps(entry, default, environ)
+        try:
+            value = next(steps)
+            while True:
+                if inspect.isawaitable(value):
+                    try:
+                        value = await value
+                    except Exception as exc:
+                        value = steps.throw(exc)
+                        continue
+                value = steps.send(value)
+        except StopIteration as stop:
+            return cast(Value, stop.value)
+
+    def convert(self, envotation: Envotation, value: Value, path: str) -> Value:
+        if envotation.is_bool:
+            result: Value = casters.cast_bool(value)
+            if result is INVALID:
                 raise VariableError(
                     f"{path} is an invalid boolean.",
                     hint=(
@@ -203,27 +1061,340 @@ class Resolver:
                         f"{FALSEY} to represent `False`."
                     ),
                 )
-            return bool(value in TRUTHY)
+            return result
 
-        if envotation.is_literal and value in envotation.args:
+        # A union with literals only accepts the literal values, or a value that already
+        # has one of its types (e.g. the result of a `Method`).
+        if envotation.literals or envotation.is_literal:
+            if envotation.is_literal_value(value):
+                return value
+            if value.__class__ not in envotation.dispatch:
+                raise VariableError(
+                    f"'{path}' contains an invalid literal '{value}'.",
+                    hint=f"One of {envotation.args} was expected.",
+                )
             return value
 
-        if envotation.args:
-            for arg in envotation.args:
-                if not isinstance(arg, (type(None), type)):
-                    if value not in envotation.args:
-                        raise VariableError(
-                            f"'{path}' contains an invalid literal '{value}'.",
-                            hint=f"One of {envotation.args} was expected.",
-                        )
-                    break
-                if isinstance(envotation.type, type):
-                    if value := envotation.cast(value):  # type: ignore[assignment]
-                        break
+        return envotation.cast(value)
 
-            return value
 
-        return envotation.cast(value)
+class Record:
+    """A frozen instance of a settings class with an attribute slot for each resolved
+    value, created by `instantiate()`.
+    """
+
+    __slots__: tuple[str, ...] = ()
+
+    def __init__(self, **values: object) -> None:
+        for attribute, value in values.items():
+            object.__setattr__(self, attribute, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"'{self.__class__.__qualname__}' is frozen.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"'{self.__class__.__qualname__}' is frozen.")
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in self)
+        return f"{self.__class__.__qualname__}({values})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return tuple(self) == tuple(other)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __iter__(self) -> Generator[tuple[str, object], None, None]:
+        for name in self.__slots__:
+            yield name, getattr(self, name)
+
+    def asdict(self) -> dict[str, object]:
+        """Return the values as a dictionary, including those of nested records."""
+        return {
+            name: value.asdict() if isinstance(value, Record) else value
+            for name, value in self
+        }
+
+
+records: WeakKeyDictionary[type, type[Record]] = WeakKeyDictionary()
+
+
+def record_type(cls: type) -> type[Record]:
+    """Return the record type for a settings class, created once per class."""
+    if cls not in records:
+        attributes = tuple(get_type_hints(cls, include_extras=True))
+        records[cls] = type(
+            cls.__name__,
+            (Record,),
+            {
+                "__slots__": attributes,
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__doc__": cls.__doc__,
+            },
+        )
+
+    return records[cls]
+
+
+@dataclass
+class State:
+    """The resolver, original defaults, and environment values used to resolve a
+    class, kept so that it can be reloaded.
+    """
+
+    resolver: Resolver
+    path: Optional[str]
+    environ: Mapping[str, str]
+    defaults: dict[str, Value] = field(default_factory=dict)
+    lock: RLock = field(default_factory=RLock)
+    # The nested sections resolved with the class tree, keyed by class and scope.
+    sections: dict[Hashable, type] = field(default_factory=dict)
+
+
+class LazyAttribute:
+    """A descriptor that resolves a settings attribute on first access and replaces
+    itself on the class with the result.
+    """
+
+    def __init__(self, entry: Entry, cls: type, state: State) -> None:
+        self.entry = entry
+        self.cls = cls
+        self.state = state
+
+    def __get__(self, instance: object, owner: Optional[type] = None) -> Value:
+        with self.state.lock:
+            value = self.cls.__dict__.get(self.entry.attribute, self)
+            if value is self:
+                value = self.resolve()
+                setattr(self.cls, self.entry.attribute, value)
+
+        return cast(Value, value)
+
+    def resolve(self) -> Union[Value, type]:
+        entry, state = self.entry, self.state
+        section = entry.section
+        if section is None:
+            default = state.defaults[entry.attribute]
+            return state.resolver.get(entry, default, state.environ)
+
+        environ = state.environ
+        resolver, path, resolved, key = state.resolver.nested(
+            section, self.cls, environ
+        )
+        if key not in resolved:
+            target = section_target(section)
+            values = resolver.defer(target, path, environ, state.lock, resolved)
+            resolved.setdefault(key, populate(target, values))
+
+        return resolved[key]
+
+
+def preload(cls: type[Class]) -> type[Class]:
+    """Resolve every lazy attribute of a class and its nested sections at once."""
+    envotations: set[str] = getattr(cls, "__envotations__", set())
+    for attribute in [attribute for attribute in vars(cls) if attribute in envotations]:
+        value = getattr(cls, attribute)
+        if value is not cls and hasattr(value, "__envotations__"):
+            preload(value)
+
+    return cls
+
+
+def reload(
+    cls: type,
+    environ: Optional[Mapping[str, str]] = None,
+) -> dict[str, tuple[Value, Value]]:
+    """Re-resolve the attributes of a decorated class (and its nested sections) whose
+    environment variables changed since they were last resolved.
+
+    Attributes backed by unchanged variables keep their values, including the results
+    of `Function` and `Method` arguments. A mapping of the path for each attribute that
+    changed to its old and new values is returned. Neither the class nor its sections
+    are changed if any changed variable fails to resolve. A class resolved from
+    `Layered` sources loads them again unless another environment is given.
+    """
+    state: Optional[State] = vars(cls).get("__envotate_state__")
+    if state is None:
+        raise TypeError(f"'{cls.__qualname__}' has not been configured by envotate.")
+
+    if environ is None and isinstance(state.environ, Layered):
+        environ = state.environ.refresh()
+    environ = snapshot(environ)
+    changed: dict[str, tuple[Value, Value]] = {}
+    with ExitStack() as locks, cached_stats():
+        # Every changed variable in the tree is resolved before any class is modified.
+        for cls, state, updates in stage_reload(cls, state, environ, locks):
+            state.environ = environ
+            exportable = {}
+            export = state.resolver.export
+            for entry, value in updates:
+                previous = getattr(cls, entry.attribute)
+                setattr(cls, entry.attribute, value)
+                if export and entry.attribute in export or export == {"__all__"}:
+                    exportable[entry.attribute] = value
+                if previous != value:
+                    changed[entry.path] = (previous, value)
+
+            if exportable:
+                sys.modules[cls.__module__].__dict__.update(exportable)
+
+    return changed
+
+
+def stage_reload(
+    cls: type,
+    state: State,
+    environ: Mapping[str, str],
+    locks: ExitStack,
+) -> list[tuple[type, State, list[tuple[Entry, Value]]]]:
+    """Resolve the changed variables of a class and its nested sections without
+    modifying them, holding the lock of each class until the updates are applied.
+    """
+    locks.enter_context(state.lock)
+    staged = []
+    updates: list[tuple[Entry, Value]] = []
+    for entry in state.resolver.compile(cls, state.path).entries:
+        if entry.section is not None:
+            section = vars(cls).get(entry.attribute)
+            if isinstance(section, type) and "__envotate_state__" in vars(section):
+                section_state = vars(section)["__envotate_state__"]
+                staged.extend(stage_reload(section, section_state, environ, locks))
+            continue
+        if isinstance(vars(cls).get(entry.attribute), LazyAttribute):
+            continue
+        if environ.get(entry.key) != state.environ.get(entry.key):
+            default = state.defaults[entry.attribute]
+            value = state.resolver.get(entry, default, environ)
+            updates.append((entry, value))
+    staged.append((cls, state, updates))
+
+    return staged
+
+
+def origin(cls: type, attribute: str) -> Optional[str]:
+    """Return the name of the source that provided the value of an attribute of a
+    configured class, or `None` if it was not read from a variable (e.g. it kept its
+    default or is a nested section).
+
+    The name is `'environ'` unless the class was resolved from `Layered` sources.
+    """
+    state: Optional[State] = vars(cls).get("__envotate_state__")
+    if state is None:
+        raise TypeError(f"'{cls.__qualname__}' has not been configured by envotate.")
+
+    for entry in state.resolver.compile(cls, state.path).entries:
+        if entry.attribute == attribute and entry.section is None:
+            if isinstance(state.environ, Layered):
+                return state.environ.origin(entry.key)
+            return "environ" if entry.key in state.environ else None
+
+    return None
+
+
+def validate(
+    cls: type,
+    /,
+    *,
+    prefix: Optional[str] = None,
+    aliases: Optional[dict[str, str]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+    raise_errors: bool = True,
+    strict: bool = False,
+) -> list[tuple[str, str, Error]]:
+    """Resolve every attribute of a class and its nested sections in a single pass
+    without modifying them, raising a `ValidationError` that lists every missing,
+    invalid, or uncastable variable (and, if `strict`, every unknown variable under the
+    prefix).
+
+    A class that has already been decorated is validated with the options it was
+    decorated with unless a prefix or aliases are provided. If `raise_errors` is false
+    the `(path, key, error)` tuples are returned instead.
+    """
+    state: Optional[State] = vars(cls).get("__envotate_state__")
+    if state is not None and prefix is None and aliases is None:
+        resolver, path = state.resolver, state.path
+    else:
+        resolver, path = Resolver(prefix=prefix, aliases=aliases, export=None), None
+
+    environ = snapshot(environ)
+    errors: list[tuple[str, str, Error]] = []
+    if strict:
+        errors.extend(resolver.unknown(cls, environ))
+    with cached_stats():
+        resolver.validate(cls, path, environ, errors)
+    if errors and raise_errors:
+        raise ValidationError(errors)
+
+    return errors
+
+
+def instantiate(
+    cls: type,
+    /,
+    *,
+    prefix: Optional[str] = None,
+    aliases: Optional[dict[str, str]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+    hook: Optional[Hook] = None,
+) -> Record:
+    """Resolve a class (which is left unmodified) into a frozen `Record` instance with
+    a slot for each attribute, and a nested record for each nested section.
+
+    Each call returns an independent instance, so settings resolved from different
+    environments can coexist.
+    """
+    resolver = Resolver(prefix=prefix, aliases=aliases, export=None, hook=hook)
+    errors: list[tuple[str, str, Error]] = []
+    with cached_stats():
+        shadow: type = resolver.validate(cls, None, environ, errors)
+    if errors:
+        raise errors[0][2]
+
+    return resolver.record(cls, shadow)
+
+
+def resolve_many(
+    cls: type,
+    envs: Iterable[Mapping[str, str]],
+    /,
+    *,
+    prefix: Optional[str] = None,
+    aliases: Optional[dict[str, str]] = None,
+    hook: Optional[Hook] = None,
+    raise_errors: bool = True,
+) -> Generator[Union[Record, ValidationError], None, None]:
+    """Resolve a class (which is left unmodified) against each of many environment
+    mappings, lazily yielding a frozen `Record` for each one as `instantiate()` would.
+
+    The class is analyzed once, and an attribute is only resolved again for an
+    environment value that has not been seen before, so identical values (and
+    identical nested sections) are shared between the records. Attributes with
+    arguments that receive the class as context are resolved for every mapping.
+
+    A `ValidationError` listing every error for a mapping is raised, or yielded in
+    place of its record if `raise_errors` is false.
+    """
+    resolver = Resolver(prefix=prefix, aliases=aliases, export=None, hook=hook)
+    memo: dict[tuple[str, str, Optional[str]], Value] = {}
+    interned: dict[Record, Record] = {}
+    for environ in envs:
+        # Bound the memory used for values unique to a few mappings (e.g. an ID).
+        if len(memo) > MEMO_SIZE or len(interned) > MEMO_SIZE:
+            memo.clear()
+            interned.clear()
+        errors: list[tuple[str, str, Error]] = []
+        with cached_stats():
+            shadow: type = resolver.validate(cls, None, environ, errors, memo)
+        if not errors:
+            yield resolver.record(cls, shadow, interned=interned)
+        elif raise_errors:
+            raise ValidationError(errors)
+        else:
+            yield ValidationError(errors)
 
 
 def configure(
@@ -233,17 +1404,74 @@ def configure(
     prefix: Optional[str],
     aliases: Optional[dict[str, str]],
     export: Optional[set[str]],
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_values: bool = False,
+    lazy: bool = False,
+    environ: Optional[Mapping[str, str]] = None,
+    hook: Optional[Hook] = None,
+    workers: Optional[int] = None,
+    strict: bool = False,
 ) -> None:
     """Update the class attributes with the result of the load operation."""
 
-    cls.__envotations__ = set()  # type: ignore[attr-defined]
-    exportable = {}
     resolver = Resolver(
         prefix=prefix,
         aliases=aliases,
         export=export,
+        cache_dir=cache_dir,
+        hook=hook,
+        workers=workers,
     )
-    for attribute, value in resolver.resolve(cls):
+    if strict:
+        environ = snapshot(environ)
+        unknown = resolver.unknown(cls, environ)
+        if unknown:
+            raise ValidationError(unknown)
+
+    cls.__envotations__ = set()  # type: ignore[attr-defined]
+    exportable = {}
+    values: Iterable[tuple[str, object]]
+    if lazy:
+        values = resolver.defer(cls, environ=environ)
+    elif cache_values:
+        values = resolver.cached(cls, environ=environ)
+    else:
+        values = resolver.resolve(cls, environ=environ)
+    with cached_stats():
+        for attribute, value in values:
+            setattr(cls, attribute, value)
+            cls.__envotations__.add(attribute)  # type: ignore[attr-defined]
+            if export and attribute in export or export == {"__all__"}:
+                exportable[attribute] = value
+
+    # Exported attributes are module variables, so lazy ones are resolved now.
+    for attribute in exportable:
+        exportable[attribute] = getattr(cls, attribute)
+
+    if exportable:
+        sys.modules[cls.__module__].__dict__.update(exportable)
+
+
+async def aresolve(
+    cls: type[Class],
+    /,
+    *,
+    prefix: Optional[str] = None,
+    aliases: Optional[dict[str, str]] = None,
+    export: Optional[set[str]] = None,
+    environ: Optional[Mapping[str, str]] = None,
+    hook: Optional[Hook] = None,
+) -> type[Class]:
+    """Configure a class from environment variables the same way as `envotate()`,
+    resolving independent attributes concurrently and awaiting annotated arguments
+    (e.g. a `Function` wrapping a coroutine function) that return awaitables.
+    """
+    cls.__envotations__ = set()  # type: ignore[attr-defined]
+    resolver = Resolver(prefix=prefix, aliases=aliases, export=export, hook=hook)
+    exportable = {}
+    with cached_stats():
+        values = await resolver.aresolve(cls, environ=environ)
+    for attribute, value in values:
         setattr(cls, attribute, value)
         cls.__envotations__.add(attribute)  # type: ignore[attr-defined]
         if export and attribute in export or export == {"__all__"}:
@@ -252,10 +1480,11 @@ def configure(
     if exportable:
         sys.modules[cls.__module__].__dict__.update(exportable)
 
+    return cls
+
 
 @overload
-def envotate(__cls: type[Class], /) -> type[Class]:
-    ...  # pragma: no cover
+def envotate(__cls: type[Class], /) -> type[Class]: ...  # pragma: no cover
 
 
 @overload
@@ -264,8 +1493,14 @@ def envotate(
     prefix: str = ...,
     export: Optional[set[str]] = ...,
     aliases: Optional[dict[str, str]] = ...,
-) -> Callable[[type[Class]], type[Class]]:
-    ...  # pragma: no cover
+    cache_dir: Optional[Union[str, Path]] = ...,
+    cache_values: bool = ...,
+    lazy: bool = ...,
+    environ: Optional[Mapping[str, str]] = ...,
+    hook: Optional[Hook] = ...,
+    workers: Optional[int] = ...,
+    strict: bool = ...,
+) -> Callable[[type[Class]], type[Class]]: ...  # pragma: no cover
 
 
 def envotate(
@@ -275,6 +1510,13 @@ def envotate(
     prefix: Optional[str] = None,
     aliases: Optional[dict[str, str]] = None,
     export: Optional[set[str]] = None,
+    cache_dir: Optional[Union[str, Path]] = None,
+    cache_values: bool = False,
+    lazy: bool = False,
+    environ: Optional[Mapping[str, str]] = None,
+    hook: Optional[Hook] = None,
+    workers: Optional[int] = None,
+    strict: bool = False,
 ) -> Union[type[Class], Callable[[type[Class]], type[Class]]]:
     """Decorate a class to be configured from environment variables according to the
     type annotations of the class.
@@ -288,6 +1530,29 @@ def envotate(
     * **export** - A set of one or more class attributes to export as variables in the
     module namespace for the class. If the set consists of a single string '__all__'
     then all of the attributes will be exported.
+    * **cache_dir** - A directory used to persist the compiled plan for the class,
+    keyed by a hash of the module source and the envotate version, so that later
+    processes can skip evaluating the annotations. The plan is not loaded if a module
+    that defines its annotation types or arguments has changed. A plan is not
+    persisted if its annotations cannot be pickled (e.g. a type or argument defined
+    in a function body).
+    * **cache_values** - Also persist the resolved values of the class and its nested
+    sections to `cache_dir`, keyed by a hash of the sources, options, and environment,
+    so that later processes (e.g. spawned workers) can skip resolving them. The values
+    are stored unencrypted in files that only their owner can read.
+    * **lazy** - Resolve each attribute (and nested section) on first access instead
+    of when the class is decorated. Use `preload()` to resolve them all at once.
+    * **environ** - A mapping to resolve the variables from instead of `os.environ`. A
+    single immutable copy is taken so that resolution sees one consistent view.
+    * **hook** - A callable that receives a timed `envotate.hooks.Event` for each
+    environment lookup, annotated argument, cast, and nested section, e.g. an
+    `envotate.hooks.Collector` to find the slowest attributes.
+    * **workers** - The maximum number of threads used to resolve attributes with
+    annotated arguments (e.g. `File` or `Function`) and nested sections in parallel.
+    The thread pool is skipped when a class has too few of them for it to help.
+    * **strict** - Raise a `ValidationError` listing every variable under the prefix
+    that does not match an attribute or alias (e.g. a misspelling), with the nearest
+    match as a suggestion. Requires a prefix.
     """
 
     def wrap(cls: type[Class]) -> type[Class]:
@@ -296,6 +1561,13 @@ def envotate(
             prefix=prefix,
             aliases=aliases,
             export=export,
+            cache_dir=cache_dir,
+            cache_values=cache_values,
+            lazy=lazy,
+            environ=environ,
+            hook=hook,
+            workers=workers,
+            strict=strict,
         )
 
         return cls
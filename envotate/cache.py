@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import logging
+import os
+import pickle
+import re
+import sys
+import tempfile
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from types import BuiltinFunctionType, FunctionType, ModuleType
+from typing import Any, Iterable, Optional, Union, get_args
+
+logger = logging.getLogger(__name__)
+
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@lru_cache(maxsize=None)
+def get_version() -> str:
+    try:
+        return metadata.version("envotate")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class Pickler(pickle.Pickler):
+    """A pickler that records the module of every class and function that is pickled
+    by reference, as the result depends on their source.
+    """
+
+    def __init__(self, file: io.BytesIO) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.modules: set[str] = set()
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, (type, FunctionType, BuiltinFunctionType)):
+            module = getattr(obj, "__module__", None)
+            if isinstance(module, str):
+                self.modules.add(module)
+
+        return NotImplemented
+
+
+def find_modules(module: str, annotations: Iterable[Any]) -> set[str]:
+    """Return the modules that the values used in the annotations of a module were
+    imported from.
+
+    A value such as a type alias (e.g. `Port = Annotated[int, Choice(...)]`) does not
+    refer to the module that defines it, so the module is found by the name that the
+    value is imported as instead.
+    """
+    namespace = getattr(sys.modules.get(module), "__dict__", {})
+    names: set[str] = set()
+    objects: set[int] = set()
+    pending = list(annotations)
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, str):
+            names.update(IDENTIFIER.findall(annotation))
+        else:
+            objects.add(id(annotation))
+            pending.extend(
+                arg for arg in get_args(annotation) if not isinstance(arg, str)
+            )
+    names.update(name for name, value in namespace.items() if id(value) in objects)
+
+    found: set[str] = set()
+    for name in names:
+        value = namespace.get(name)
+        if isinstance(value, ModuleType):
+            found.add(value.__name__)
+            continue
+        # Classes and functions are found from the module they refer to when pickled.
+        home = getattr(value, "__module__", None)
+        if value is None or (
+            isinstance(home, str)
+            and getattr(sys.modules.get(home), name, None) is value
+        ):
+            continue
+        for other, imported in list(sys.modules.items()):
+            if other != module and getattr(imported, "__dict__", {}).get(name) is value:
+                found.add(other)
+
+    return found
+
+
+def source_hash(modules: Iterable[str], *extra: object) -> Optional[str]:
+    """Return a digest of the source files for one or more modules combined with the
+    version of envotate and any extra values that should invalidate the cached result,
+    or `None` when a module has no readable source file.
+    """
+    digest = hashlib.sha256(get_version().encode())
+    for module in dict.fromkeys(modules):
+        filename = getattr(sys.modules.get(module), "__file__", None)
+        if not filename:
+            return None
+        try:
+            digest.update(Path(filename).read_bytes())
+        except OSError:
+            return None
+
+    for value in extra:
+        digest.update(repr(value).encode())
+
+    return digest.hexdigest()
+
+
+def make_filename(directory: Union[str, Path], name: str, digest: str) -> Path:
+    return Path(directory) / f"{name}.{digest[:16]}.pickle"
+
+
+def load(directory: Union[str, Path], name: str, digest: str) -> Optional[Any]:
+    """Load a previously dumped object, or `None` if it is missing, unreadable, or the
+    source of a module that it depends on has changed since it was dumped.
+
+    The cache directory must only be writable by trusted users because the contents
+    are unpickled.
+    """
+    filename = make_filename(directory, name, digest)
+    try:
+        with filename.open("rb") as f:
+            modules, dependencies = pickle.load(f)
+            if source_hash(modules) != dependencies:
+                logger.debug("Ignoring stale cache file '%s'.", filename)
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        AttributeError,
+        EOFError,
+        TypeError,
+        ValueError,
+    ) as exc:
+        logger.debug("Ignoring unreadable cache file '%s': %s", filename, exc)
+        return None
+
+
+def dump(
+    directory: Union[str, Path],
+    name: str,
+    digest: str,
+    obj: object,
+    modules: Iterable[str] = (),
+) -> bool:
+    """Dump an object to the cache directory, returning whether it was written.
+
+    The sources of the modules that define the classes and functions in the object, and
+    of any other modules given, are checked when it is loaded. Objects that cannot be
+    pickled (e.g. lambdas or classes defined in a function body), or that cannot be
+    written (e.g. to a read-only directory), are skipped rather than treated as an
+    error.
+    """
+    filename = make_filename(directory, name, digest)
+    buffer = io.BytesIO()
+    pickler = Pickler(buffer)
+    try:
+        pickler.dump(obj)
+    except (pickle.PicklingError, AttributeError, TypeError) as exc:
+        logger.debug("Skipping cache for '%s': %s", name, exc)
+        return False
+
+    # Modules without a source file (e.g. `builtins`) cannot change.
+    dependencies = sorted(
+        module
+        for module in pickler.modules.union(modules)
+        if getattr(sys.modules.get(module), "__file__", None)
+    )
+    dependency_hash = source_hash(dependencies)
+    if dependency_hash is None:
+        logger.debug("Skipping cache for '%s': a module has no readable source.", name)
+        return False
+    header = pickle.dumps((dependencies, dependency_hash))
+
+    # Each writer uses its own temporary file, so concurrent processes writing the same
+    # entry (e.g. spawned workers) each replace it atomically.
+    tmp = None
+    try:
+        # The files are only readable by their owner (e.g. resolved secrets).
+        filename.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=filename.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(header + buffer.getvalue())
+        os.replace(tmp, filename)
+    except OSError as exc:
+        logger.warning("Skipping cache for '%s': %s", name, exc)
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+        return False
+
+    return True
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+import re
+from array import array
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    overload,
+)
+
+from typing_extensions import TypeAlias
+
+# Returned by a caster for a value that cannot be converted to its type.
+INVALID: Any = type("Invalid", (), {"__repr__": lambda self: "INVALID"})()
+
+Caster: TypeAlias = Callable[[Any], Any]
+
+FALSEY = {"false", "no", "n", "0"}
+TRUTHY = {"true", "yes", "y", "1"}
+BOOLEANS = {**dict.fromkeys(FALSEY, False), **dict.fromkeys(TRUTHY, True)}
+
+INT = re.compile(r"\s*[+-]?\d+\s*", re.ASCII)
+FLOAT = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*", re.ASCII)
+DURATION = re.compile(
+    r"\s*(?:(?P<days>[+-]?\d+) days?,\s*)?"
+    r"(?P<hours>\d+):(?P<minutes>\d{2}):(?P<seconds>\d{2}(?:\.\d{1,6})?)\s*",
+    re.ASCII,
+)
+ISO_DURATION = re.compile(
+    r"\s*P(?:(?P<weeks>\d+(?:\.\d+)?)W)?(?:(?P<days>\d+(?:\.\d+)?)D)?"
+    r"(?:T(?:(?P<hours>\d+(?:\.\d+)?)H)?(?:(?P<minutes>\d+(?:\.\d+)?)M)?"
+    r"(?:(?P<seconds>\d+(?:\.\d+)?)S)?)?\s*",
+    re.ASCII,
+)
+
+
+def construct(type_: Callable[[Any], Any], value: Any) -> Any:
+    """Call a type with a value, returning `INVALID` instead of raising for an invalid
+    value. Used for types without a registered caster, and for the values a caster's
+    fast path does not recognize.
+    """
+    try:
+        return type_(value)
+    except (TypeError, ValueError, ArithmeticError):
+        return INVALID
+
+
+def cast_str(value: Any) -> Any:
+    return value if isinstance(value, str) else str(value)
+
+
+def cast_int(value: Any) -> Any:
+    # Anything other than ASCII digits (e.g. underscores) takes the slower path.
+    if isinstance(value, str) and INT.fullmatch(value):
+        return int(value)
+    if isinstance(value, bool):
+        return INVALID
+    return construct(int, value)
+
+
+def cast_float(value: Any) -> Any:
+    if isinstance(value, str) and FLOAT.fullmatch(value):
+        return float(value)
+    if isinstance(value, bool):
+        return INVALID
+    return construct(float, value)
+
+
+def cast_bool(value: Any) -> Any:
+    if isinstance(value, bool):
+        return value
+    return BOOLEANS.get(str(value).strip().lower(), INVALID)
+
+
+def cast_decimal(value: Any) -> Any:
+    if isinstance(value, str) and FLOAT.fullmatch(value):
+        return Decimal(value.strip())
+    return construct(Decimal, value)
+
+
+def cast_bytes(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.encode()
+    return construct(bytes, value)
+
+
+def cast_datetime(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        return INVALID
+    return construct(datetime.fromisoformat, value.strip().replace("Z", "+00:00"))
+
+
+def cast_date(value: Any) -> Any:
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return value
+    if not isinstance(value, str):
+        return INVALID
+    return construct(date.fromisoformat, value.strip())
+
+
+def cast_time(value: Any) -> Any:
+    if isinstance(value, time):
+        return value
+    if not isinstance(value, str):
+        return INVALID
+    return construct(time.fromisoformat, value.strip())
+
+
+def cast_timedelta(value: Any) -> Any:
+    """Convert a number of seconds, `[D day[s], ]H:MM:SS[.ffffff]` (the format of
+    `str(timedelta)`), or an ISO 8601 duration such as `PT1H30M` to a `timedelta`.
+    """
+    if isinstance(value, timedelta):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return timedelta(seconds=value)
+    if not isinstance(value, str):
+        return INVALID
+
+    if FLOAT.fullmatch(value):
+        return timedelta(seconds=float(value))
+
+    match = DURATION.fullmatch(value) or ISO_DURATION.fullmatch(value)
+    if match is None or not any(match.groups()):
+        return INVALID
+
+    parts = {name: float(part) for name, part in match.groupdict().items() if part}
+
+    return timedelta(**parts)
+
+
+def cast_path(value: Any) -> Any:
+    if isinstance(value, Path):
+        return value
+    return construct(Path, value)
+
+
+casters: dict[Any, Caster] = {
+    str: cast_str,
+    int: cast_int,
+    float: cast_float,
+    bool: cast_bool,
+    Decimal: cast_decimal,
+    bytes: cast_bytes,
+    datetime: cast_datetime,
+    date: cast_date,
+    time: cast_time,
+    timedelta: cast_timedelta,
+    Path: cast_path,
+}
+
+
+@overload
+def register(type_: Any, caster: Caster) -> Caster: ...  # pragma: nocover
+
+
+@overload
+def register(
+    type_: Any, caster: None = ...
+) -> Callable[[Caster], Caster]: ...  # pragma: nocover
+
+
+def register(
+    type_: Any,
+    caster: Optional[Caster] = None,
+) -> Any:
+    """Register the caster used to convert values to a type, replacing any existing
+    caster. May be used as a decorator.
+
+    A caster receives the value (usually a string) and returns the converted value,
+    or `INVALID` if the value cannot be converted, rather than raising.
+    """
+    if caster is None:
+        return lambda caster: register(type_, caster)
+
+    casters[type_] = caster
+
+    return caster
+
+
+def cast(type_: Any, value: Any) -> Any:
+    """Convert a value to a type using its registered caster, returning `INVALID` if
+    the value cannot be converted.
+    """
+    if value.__class__ is type_:
+        return value
+
+    caster = casters.get(type_)
+    if caster is None:
+        return construct(type_, value)
+
+    return caster(value)
+
+
+COLLECTIONS = (list, tuple, set, frozenset, dict)
+TYPECODES = {int: "q", float: "d"}
+
+
+def split(value: Any, delimiter: str) -> list[Any]:
+    """Split a delimited string into its stripped items, or return the items of an
+    existing collection (e.g. the result of `Split`).
+    """
+    if isinstance(value, str):
+        if not value.strip():
+            return []
+        return [item.strip() for item in value.split(delimiter)]
+    if isinstance(value, Iterable):
+        return list(value)
+    return [value]
+
+
+def cast_items(type_: Any, items: list[Any]) -> Any:
+    """Convert every item to a type in a single pass, returning `INVALID` if any item
+    cannot be converted.
+    """
+    if type_ is Any:
+        return items
+    if type_ in (int, float):
+        # A C-level map is far faster than calling the caster for each item.
+        try:
+            return list(map(type_, items))
+        except (TypeError, ValueError):
+            pass
+
+    caster = casters.get(type_)
+    results = [
+        (
+            item
+            if item.__class__ is type_
+            else (caster(item) if caster else construct(type_, item))
+        )
+        for item in items
+    ]
+    if any(result is INVALID for result in results):
+        return INVALID
+
+    return results
+
+
+def cast_collection(
+    origin: Any,
+    args: tuple[Any, ...],
+    value: Any,
+    *,
+    delimiter: str = ",",
+    separator: str = "=",
+    compact: bool = False,
+) -> Any:
+    """Convert a delimited value (or an existing collection) to a `list`, `tuple`,
+    `set`, `frozenset`, or `dict` of the annotated item types, returning `INVALID` if
+    any item cannot be converted.
+    """
+    if not args and isinstance(value, origin):
+        # e.g. a `dict` from an annotated argument, which may be a subclass.
+        return value
+
+    if origin is dict:
+        key_type, value_type = args or (Any, Any)
+        if isinstance(value, Mapping):
+            keys, values = list(value), list(value.values())
+        elif not isinstance(value, str):
+            # e.g. a list decoded by `Json`.
+            return INVALID
+        else:
+            pairs = [item.partition(separator) for item in split(value, delimiter)]
+            if any(not sep for _, sep, _ in pairs):
+                return INVALID
+            keys = [key.strip() for key, _, _ in pairs]
+            values = [item.strip() for _, _, item in pairs]
+        keys = cast_items(key_type, keys)
+        values = cast_items(value_type, values)
+        if keys is INVALID or values is INVALID:
+            return INVALID
+        return dict(zip(keys, values))
+
+    if isinstance(value, Mapping):
+        # Only the keys would be kept.
+        return INVALID
+
+    items = split(value, delimiter)
+    if origin is tuple and args and args[-1] is not Ellipsis:
+        # A fixed-length tuple, e.g. `tuple[str, int]`.
+        if len(items) != len(args):
+            return INVALID
+        results = [cast_items(arg, [item]) for arg, item in zip(args, items)]
+        if any(result is INVALID for result in results):
+            return INVALID
+        return tuple(result[0] for result in results)
+
+    item_type = args[0] if args else Any
+    items = cast_items(item_type, items)
+    if items is INVALID:
+        return INVALID
+
+    if compact:
+        if origin in (list, tuple) and item_type in TYPECODES:
+            try:
+                return array(TYPECODES[item_type], items)
+            except OverflowError:
+                pass
+        elif origin is set:
+            return frozenset(items)
+
+    return items if origin is list else origin(items)
+
+
+class LazyItems:
+    """An iterable that splits a delimited value and converts each item as it is
+    iterated, so a very large value is never held as a list of converted items.
+    """
+
+    def __init__(self, value: str, type_: Any, delimiter: str = ",") -> None:
+        self.value = value
+        self.type = type_
+        self.delimiter = delimiter
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.type.__qualname__})"
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.iterate()
+
+    def iterate(self) -> Generator[Any, None, None]:
+        if not self.value.strip():
+            return
+
+        start = 0
+        while True:
+            end = self.value.find(self.delimiter, start)
+            item = self.value[start : end if end != -1 else None].strip()
+            result = cast(self.type, item)
+            if result is INVALID:
+                raise ValueError(f"'{item}' is not a valid {self.type.__qualname__}.")
+            yield result
+            if end == -1:
+                return
+            start = end + len(self.delimiter)
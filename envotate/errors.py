@@ -16,3 +16,17 @@ class VariableError(Error):
 
 class AnnotationError(Error):
     """An annotation is unsupported or invalid."""
+
+
+class ValidationError(Error):
+    """One or more variables failed validation.
+
+    The `errors` attribute contains a `(path, key, error)` tuple for each failure.
+    """
+
+    def __init__(self, errors: list[tuple[str, str, Error]]) -> None:
+        self.errors = errors
+        lines = [f"{len(errors)} variable(s) failed validation:"]
+        for path, key, error in errors:
+            lines.append(f"  {path} [{key}]: {error}" if key else f"  {path}: {error}")
+        super().__init__("\n".join(lines))
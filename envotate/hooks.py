@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Literal, Optional
+
+from typing_extensions import TypeAlias
+
+Kind = Literal["attribute", "lookup", "apply", "cast", "section"]
+
+
+@dataclass(frozen=True)
+class Event:
+    """A timed step of resolving a settings class.
+
+    * **attribute** - The whole resolution of an attribute.
+    * **lookup** - Reading the environment key (or default) for an attribute.
+    * **apply** - Evaluating one annotated argument, named by `arg`.
+    * **cast** - Converting the value to the annotated type.
+    * **section** - Resolving a nested section class, named by `arg`.
+    """
+
+    kind: Kind
+    path: str
+    key: str
+    duration: float
+    arg: Optional[str] = None
+
+
+Hook: TypeAlias = Callable[[Event], None]
+
+
+class Collector:
+    """A hook that records every event and summarizes the slowest steps.
+
+    ```python
+    collector = Collector()
+
+    @envotate(hook=collector)
+    class Settings:
+        ...
+
+    print(collector.summary())
+    ```
+    """
+
+    def __init__(self) -> None:
+        self.events: list[Event] = []
+
+    def __call__(self, event: Event) -> None:
+        self.events.append(event)
+
+    def slowest(self, kind: Kind = "attribute", limit: int = 10) -> list[Event]:
+        """Return the slowest events of a kind, combining the durations of events for
+        the same path and argument (e.g. an attribute that was reloaded).
+        """
+        totals: dict[tuple[str, str, Optional[str]], float] = defaultdict(float)
+        for event in self.events:
+            if event.kind == kind:
+                totals[event.path, event.key, event.arg] += event.duration
+
+        ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+        return [
+            Event(kind, path, key, duration, arg)
+            for (path, key, arg), duration in ranked[:limit]
+        ]
+
+    def summary(self, limit: int = 10) -> str:
+        lines = []
+        for kind, title in (("attribute", "attributes"), ("apply", "arguments")):
+            lines.append(f"Slowest {title}:")
+            for event in self.slowest(kind, limit):  # type: ignore[arg-type]
+                name = f"{event.path} [{event.key}]"
+                if event.arg:
+                    name = f"{name} {event.arg}"
+                lines.append(f"  {event.duration * 1000:>10.3f}ms  {name}")
+
+        return "\n".join(lines)
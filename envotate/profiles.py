@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Mapping, Optional
+
+from envotate import State, envotate, snapshot
+from envotate.errors import VariableError
+from envotate.typing import Class
+
+
+class Profiles:
+    """Profile overlays of a decorated settings class, of which only the one named by
+    an environment variable is resolved.
+
+    A profile is a subclass of the base class that adds or overrides attributes. When
+    it is selected it is decorated with the prefix and aliases of the base class, and
+    inherits the values that the base class already resolved for every other attribute.
+
+    ```python
+    profiles = Profiles(BaseSettings, "APP_PROFILE")
+
+
+    @profiles.register("prod")
+    class ProdSettings(BaseSettings):
+        DEBUG: bool = False
+
+
+    Settings = profiles.select()
+    ```
+    """
+
+    def __init__(
+        self,
+        base: type,
+        variable: str,
+        *,
+        default: Optional[str] = None,
+    ) -> None:
+        state: Optional[State] = vars(base).get("__envotate_state__")
+        if state is None:
+            name = base.__qualname__
+            raise TypeError(f"'{name}' has not been configured by envotate.")
+
+        self.base = base
+        self.variable = variable
+        self.default = default
+        self.profiles: dict[str, tuple[type, dict[str, Any]]] = {}
+        self.active: Optional[str] = None
+
+    def register(
+        self,
+        name: str,
+        **options: Any,
+    ) -> Callable[[type[Class]], type[Class]]:
+        """Register a subclass of the base class as a profile, without resolving it.
+
+        The options are passed to `envotate()` when the profile is selected, and
+        default to the prefix and aliases of the base class.
+        """
+
+        def wrap(cls: type[Class]) -> type[Class]:
+            if not issubclass(cls, self.base):
+                base = self.base.__qualname__
+                raise TypeError(f"'{cls.__qualname__}' is not a subclass of '{base}'.")
+            self.profiles[name] = (cls, options)
+
+            return cls
+
+        return wrap
+
+    def select(self, environ: Optional[Mapping[str, str]] = None) -> type:
+        """Resolve and return the profile named by the environment variable, or the
+        base class if it is not set and there is no default.
+
+        The environment defaults to the one that the base class was resolved from. A
+        profile is only resolved the first time that it is selected.
+        """
+        state: State = vars(self.base)["__envotate_state__"]
+        environ = snapshot(state.environ if environ is None else environ)
+        name = environ.get(self.variable, self.default)
+        self.active = name
+        if name is None:
+            return self.base
+
+        if name not in self.profiles:
+            raise VariableError(
+                f"'{name}' is not a profile of '{self.base.__qualname__}'.",
+                hint=f"Set {self.variable} to one of {sorted(self.profiles)}.",
+            )
+
+        cls, options = self.profiles[name]
+        if "__envotate_state__" not in vars(cls):
+            resolver = state.resolver
+            options = {
+                "prefix": resolver.prefix,
+                "aliases": resolver.aliases,
+                "environ": environ,
+                **options,
+            }
+            envotate(**options)(cls)
+
+        return cls
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Generator, Iterable, Iterator, Mapping, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Files at least this large are memory-mapped instead of read into memory.
+MMAP_THRESHOLD = 1 << 20
+
+LINE = re.compile(
+    r"^\s*(?:export\s+)?(?P<key>[A-Za-z_][A-Za-z0-9_.]*)\s*=\s*(?P<value>.*?)\s*$",
+    re.DOTALL,
+)
+DOUBLE_QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"\s*(?:#.*)?$', re.DOTALL)
+SINGLE_QUOTED = re.compile(r"'([^']*)'\s*(?:#.*)?$", re.DOTALL)
+# A line of a quoted value up to its closing quote, whatever follows it.
+DOUBLE_CLOSING = re.compile(r'(?:[^"\\]|\\.)*"', re.DOTALL)
+SINGLE_CLOSING = re.compile(r"[^']*'")
+ESCAPE = re.compile(r"\\(.)", re.DOTALL)
+ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\", "$": "$"}
+
+Signature = tuple[int, int, int, int]
+
+dotenv_cache: dict[str, tuple[Signature, Mapping[str, str]]] = {}
+
+
+def unescape(value: str) -> str:
+    return ESCAPE.sub(lambda m: ESCAPES.get(m[1], m[0]), value)
+
+
+def parse_dotenv(lines: Iterable[str]) -> Generator[tuple[str, str], None, None]:
+    """Parse the lines of a dotenv file in a single pass, yielding each key and value.
+
+    Supports comments, blank lines, an `export` prefix, unquoted values with inline
+    comments, single-quoted literal values, and double-quoted values with escapes.
+    Quoted values may span multiple lines. Malformed lines are logged and skipped.
+    """
+    iterator: Iterator[tuple[int, str]] = enumerate(lines, start=1)
+    while True:
+        for number, line in iterator:
+            stripped = line.strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+
+            match = LINE.match(line)
+            if match is None:
+                logger.warning("Skipping malformed dotenv line %d: %r", number, line)
+                continue
+
+            key, value = match["key"], match["value"]
+            quote = value[:1]
+            if quote not in ("'", '"'):
+                # An inline comment must be preceded by whitespace in an unquoted value.
+                yield key, re.split(r"\s+#", value, maxsplit=1)[0]
+                continue
+
+            value = line[match.start("value") :]
+            if quote == '"':
+                pattern, closing = DOUBLE_QUOTED, DOUBLE_CLOSING
+            else:
+                pattern, closing = SINGLE_QUOTED, SINGLE_CLOSING
+            # Only a value without its closing quote continues onto the next lines,
+            # each of which is scanned once for it.
+            parts = [(number, value)]
+            if closing.match(value, 1) is None:
+                for part in iterator:
+                    parts.append(part)
+                    if closing.match(part[1]) is not None:
+                        break
+                else:
+                    logger.warning(
+                        "Skipping unterminated dotenv value for '%s' on line %d.",
+                        key,
+                        number,
+                    )
+                    # The lines after the opening quote are parsed again without it.
+                    iterator = iter(parts[1:])
+                    break
+
+            quoted = pattern.match("\n".join(part for _, part in parts))
+            if quoted is None:
+                # e.g. `KEY="value" trailing` or `KEY='it''s'`.
+                logger.warning("Skipping malformed dotenv line %d: %r", number, line)
+                continue
+
+            yield key, unescape(quoted[1]) if quote == '"' else quoted[1]
+        else:
+            return
+
+
+def read_lines(path: Path, encoding: str) -> Generator[str, None, None]:
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_THRESHOLD:
+            yield from f.read().decode(encoding).splitlines()
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                yield line.decode(encoding).rstrip("\r\n")
+
+
+def read_dotenv(
+    path: Union[str, Path],
+    *,
+    encoding: str = "utf-8",
+) -> Mapping[str, str]:
+    """Read the variables from a dotenv file into an immutable mapping.
+
+    The result is cached for the path and is only parsed again when the modification
+    time, inode, device, or size of the file changes, so repeated reads in a process
+    (or in forked workers) do no work beyond a single `stat()`.
+    """
+    path = Path(path)
+    stat = path.stat()
+    signature = (stat.st_mtime_ns, stat.st_ino, stat.st_dev, stat.st_size)
+    cache_key = os.path.abspath(path)
+    cached = dotenv_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    variables = MappingProxyType(dict(parse_dotenv(read_lines(path, encoding))))
+    dotenv_cache[cache_key] = (signature, variables)
+
+    return variables
+
+
+class Source(ABC):
+    """A layer of variables to resolve a settings class from.
+
+    Subclasses implement `load` to return every variable in the layer at once, so the
+    layers can be merged into a single index before any attribute is resolved.
+    """
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """The name that `origin()` reports for the variables of the layer."""
+
+    @abstractmethod
+    def load(self) -> Mapping[str, str]:
+        """Return every variable in the layer."""
+
+
+@dataclass(frozen=True)
+class Environ(Source):
+    """The process environment, or a mapping used in its place."""
+
+    environ: Optional[Mapping[str, str]] = None
+
+    @property
+    def name(self) -> str:
+        return "environ"
+
+    def load(self) -> Mapping[str, str]:
+        return os.environ if self.environ is None else self.environ
+
+
+@dataclass(frozen=True)
+class Dotenv(Source):
+    """A dotenv file, skipped if it does not exist unless it is `required`."""
+
+    path: Union[str, Path]
+    encoding: str = "utf-8"
+    required: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"dotenv:{self.path}"
+
+    def load(self) -> Mapping[str, str]:
+        try:
+            return read_dotenv(self.path, encoding=self.encoding)
+        except FileNotFoundError:
+            if self.required:
+                raise
+            return {}
+
+
+@dataclass(frozen=True)
+class Secrets(Source):
+    """A directory with a file for each variable (e.g. mounted Docker or Kubernetes
+    secrets), where the file name is the key and its contents are the value. A single
+    trailing newline is removed from each value.
+    """
+
+    directory: Union[str, Path]
+    encoding: str = "utf-8"
+    required: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"secrets:{self.directory}"
+
+    def load(self) -> Mapping[str, str]:
+        variables = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    with open(entry.path, encoding=self.encoding) as f:
+                        value = f.read()
+                    variables[entry.name] = value[:-1] if value[-1:] == "\n" else value
+        except FileNotFoundError:
+            if self.required:
+                raise
+
+        return variables
+
+
+class Layered(Mapping[str, str]):
+    """An immutable index of the variables merged from one or more sources, where
+    earlier sources take precedence over later ones.
+
+    The sources are each loaded once when the index is built, so resolving an
+    attribute is a single lookup rather than a probe of every source. The name of the
+    source that provided each variable is recorded in `origins`.
+    """
+
+    def __init__(self, sources: Iterable[Source]) -> None:
+        self.sources = tuple(sources)
+        self.variables: dict[str, str] = {}
+        self.origins: dict[str, str] = {}
+        for source in reversed(self.sources):
+            variables = source.load()
+            self.variables.update(variables)
+            self.origins.update(dict.fromkeys(variables, source.name))
+
+    def __getitem__(self, key: str) -> str:
+        return self.variables[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.variables)
+
+    def __len__(self) -> int:
+        return len(self.variables)
+
+    def __repr__(self) -> str:
+        names = ", ".join(source.name for source in self.sources)
+        return f"{self.__class__.__name__}({names})"
+
+    def origin(self, key: str) -> Optional[str]:
+        """Return the name of the source that provided a variable, if any."""
+        return self.origins.get(key)
+
+    def refresh(self) -> Layered:
+        """Load the sources again into a new index."""
+        return self.__class__(self.sources)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from typing import Any, Generator, Iterable, Optional
+
+
+class Trie:
+    """A trie of environment keys split into their underscore-separated segments.
+
+    Building the trie is a single pass over the keys, after which the keys under a
+    prefix are found by walking the segments of the prefix and visiting only the keys
+    beneath it, rather than testing every key.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self.root: dict[Optional[str], Any] = {}
+        for key in keys:
+            self.add(key)
+
+    def add(self, key: str) -> None:
+        node = self.root
+        for segment in key.split("_"):
+            node = node.setdefault(segment, {})
+        # The key that ends at a node is stored under `None`, which is never a segment.
+        node[None] = key
+
+    def find(self, prefix: str) -> Generator[str, None, None]:
+        """Yield each key that starts with the prefix followed by an underscore."""
+        node = self.root
+        for segment in prefix.split("_"):
+            if segment not in node:
+                return
+            node = node[segment]
+
+        stack = [child for segment, child in node.items() if segment is not None]
+        while stack:
+            node = stack.pop()
+            for segment, child in node.items():
+                if segment is None:
+                    yield child
+                else:
+                    stack.append(child)
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from enum import Flag
 from typing import (
+    Any,
+    Callable,
     Generator,
     Protocol,
     TypeVar,
@@ -11,6 +14,7 @@ from typing import (
     overload,
     runtime_checkable,
 )
+from weakref import WeakKeyDictionary
 
 from typing_extensions import TypeAlias
 
@@ -41,6 +45,57 @@ class AnnotatedArg(Protocol):
         ...  # pragma: nocover
 
 
+class Dispatch(Flag):
+    """The calling convention of an `apply` implementation, determined by whether it
+    annotates a `value` and/or `context` parameter.
+    """
+
+    NONE = 0
+    VALUE = 1
+    CONTEXT = 2
+
+
+dispatch_table: WeakKeyDictionary[Callable[..., Any], Dispatch] = WeakKeyDictionary()
+
+
+def get_dispatch(apply: Callable[..., Any]) -> Dispatch:
+    """Classify the calling convention of an `apply` callable.
+
+    The result is cached for the underlying function, so the type hints are only
+    evaluated once for each `AnnotatedArg` type (or wrapped function).
+    """
+    function = getattr(apply, "__func__", apply)
+    try:
+        return dispatch_table[function]
+    except (KeyError, TypeError):
+        pass
+
+    params = get_type_hints(apply)
+    dispatch = Dispatch.NONE
+    if "value" in params:
+        dispatch |= Dispatch.VALUE
+    if "context" in params:
+        dispatch |= Dispatch.CONTEXT
+    try:
+        dispatch_table[function] = dispatch
+    except TypeError:
+        pass
+
+    return dispatch
+
+
+def call_apply(apply: Callable[..., Value], value: Value, context: type) -> Value:
+    dispatch = get_dispatch(apply)
+    if dispatch is Dispatch.NONE:
+        return apply()
+    if dispatch is Dispatch.VALUE:
+        return apply(value)
+    if dispatch is Dispatch.CONTEXT:
+        return apply(context)
+
+    return apply(value, context)
+
+
 def get_root_arg(annotation: type) -> type:
     if origin := get_origin(annotation):
         return get_root_arg(origin)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from pathlib import Path
+from time import monotonic
+from typing import Callable, Iterable, Mapping, Optional, Union
+
+from envotate import State, reload
+from envotate.sources import Dotenv, Layered, Secrets
+from envotate.typing import Value
+
+logger = logging.getLogger(__name__)
+
+Changes = dict[str, tuple[Value, Value]]
+Callback = Callable[[Changes], None]
+Signature = tuple[tuple[str, Optional[tuple[int, ...]]], ...]
+
+
+def stat_signature(path: str) -> Optional[tuple[int, ...]]:
+    """Return the modification time, inode, device, and size of a file, combined with
+    those of every file in it for a directory, or `None` if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    signature: tuple[int, ...] = (
+        stat.st_mtime_ns,
+        stat.st_ino,
+        stat.st_dev,
+        stat.st_size,
+    )
+    if os.path.isdir(path):
+        # The mtime of a directory only changes when an entry is added or removed.
+        with os.scandir(path) as it:
+            for entry in sorted(it, key=lambda entry: entry.name):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                signature += (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+
+    return signature
+
+
+class Watcher:
+    """Poll the files that a decorated class was resolved from and reload the class
+    when any of them change, calling the subscribed callbacks with the changes.
+
+    The files are the dotenv files and secrets directories of a class resolved from
+    `Layered` sources, and any other `paths`. A class resolved from another mapping is
+    reloaded from `environ()` (or `os.environ`). A change is only applied once the
+    files have been unchanged for `debounce` seconds, so a file being written is not
+    read half way through.
+
+    ```python
+    watcher = Watcher(Settings)
+    watcher.subscribe(lambda changes: logger.info("Settings changed: %s", changes))
+    watcher.start()
+    ```
+    """
+
+    def __init__(
+        self,
+        cls: type,
+        paths: Iterable[Union[str, Path]] = (),
+        *,
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        environ: Optional[Callable[[], Mapping[str, str]]] = None,
+    ) -> None:
+        state: Optional[State] = vars(cls).get("__envotate_state__")
+        if state is None:
+            name = cls.__qualname__
+            raise TypeError(f"'{name}' has not been configured by envotate.")
+
+        self.cls = cls
+        self.interval = interval
+        self.debounce = debounce
+        self.environ = environ
+        self.paths = [os.fspath(path) for path in paths]
+        if isinstance(state.environ, Layered):
+            for source in state.environ.sources:
+                if isinstance(source, Dotenv):
+                    self.paths.append(os.fspath(source.path))
+                elif isinstance(source, Secrets):
+                    self.paths.append(os.fspath(source.directory))
+
+        self.callbacks: list[Callback] = []
+        self.current = self.pending = self.signature()
+        self.changed_at = monotonic()
+        self.stopped = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> Watcher:
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    def subscribe(self, callback: Callback) -> Callback:
+        """Register a callback for a mapping of the path of each changed attribute to
+        its old and new values. May be used as a decorator.
+        """
+        self.callbacks.append(callback)
+
+        return callback
+
+    def signature(self) -> Signature:
+        return tuple((path, stat_signature(path)) for path in self.paths)
+
+    def poll(self) -> Changes:
+        """Check the files once, reloading the class if they changed and have since
+        been unchanged for the debounce period, and return the changes.
+        """
+        signature = self.signature()
+        if signature != self.pending:
+            self.pending = signature
+            self.changed_at = monotonic()
+            if self.debounce > 0:
+                return {}
+        if signature == self.current or monotonic() - self.changed_at < self.debounce:
+            return {}
+
+        try:
+            changes = reload(self.cls, self.environ() if self.environ else None)
+        except Exception:
+            # The change is retried on the next poll until the reload succeeds.
+            logger.exception("Failed to reload '%s'.", self.cls.__qualname__)
+            return {}
+        self.current = signature
+
+        if changes:
+            for callback in self.callbacks:
+                try:
+                    callback(changes)
+                except Exception:
+                    logger.exception("Settings callback %r failed.", callback)
+
+        return changes
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.poll_interval()):
+            self.poll()
+
+    async def arun(self) -> None:
+        """Poll the files until cancelled, e.g. in `asyncio.create_task()`."""
+        while not self.stopped.is_set():
+            await asyncio.sleep(self.poll_interval())
+            # The files are read and the callbacks called without blocking the loop.
+            await asyncio.to_thread(self.poll)
+
+    def poll_interval(self) -> float:
+        # Poll again sooner while waiting for a change to settle, but not while
+        # retrying a change that failed to reload.
+        settling = monotonic() - self.changed_at < self.debounce
+        if self.pending != self.current and settling:
+            return min(self.interval, self.debounce)
+        return self.interval
+
+    def start(self) -> Watcher:
+        """Poll the files on a daemon thread until `stop()` is called."""
+        if self.thread is None or not self.thread.is_alive():
+            self.stopped.clear()
+            name = f"envotate-watcher-{self.cls.__qualname__}"
+            self.thread = threading.Thread(target=self.run, name=name, daemon=True)
+            self.thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
@@ -14,6 +14,7 @@ setup(
     description="Settings management using environment variables and type annotations.",
     long_description=get_long_description(),
     python_requires=">=3.9",
+    extras_require={"json": ["orjson"]},
     package_data={"envotate": ["py.typed"]},
     long_description_content_type="text/markdown",
     author="Jordan Eremieff",
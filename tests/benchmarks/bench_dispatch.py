@@ -0,0 +1,49 @@
+"""Compare evaluating the type hints of `apply` on every call with the cached
+dispatch table.
+
+Run with `python -m tests.benchmarks.bench_dispatch`.
+"""
+from __future__ import annotations
+
+import timeit
+from typing import get_type_hints
+
+from envotate.types import Choice, Directory, File, Function, Method, Regex, Split
+from envotate.typing import Value, get_dispatch
+
+
+def make_url(value: Value, context: type) -> Value:
+    return value
+
+
+ARGS = [
+    Choice(["a", "b"]),
+    Directory(),
+    File(),
+    Function(make_url),
+    Method("make_url"),
+    Regex(r"^a$"),
+    Split(),
+]
+
+
+def uncached() -> None:
+    for arg in ARGS:
+        params = get_type_hints(arg.apply)
+        "value" in params and "context" in params
+
+
+def cached() -> None:
+    for arg in ARGS:
+        get_dispatch(arg.apply)
+
+
+def main(number: int = 10_000) -> None:
+    for name, func in (("get_type_hints", uncached), ("get_dispatch", cached)):
+        seconds = timeit.timeit(func, number=number)
+        per_arg = seconds / (number * len(ARGS)) * 1e6
+        print(f"{name:>16}: {seconds:.3f}s total, {per_arg:.2f}us per arg")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Benchmarks for the decorator and resolver hot paths.
+
+Run with `python -m tests.benchmarks.bench_resolver`. Use `--save baseline.json` to
+record the results for a version and `--compare baseline.json` to report the change
+against them (exiting with a non-zero status if any benchmark regressed by more than
+`--threshold`).
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Annotated, Any, Callable, Literal, Optional, Union
+
+from envotate import Envotation, Resolver, envotate
+from envotate.types import (
+    Choice,
+    Directory,
+    DjangoDSN,
+    File,
+    Function,
+    Method,
+    Regex,
+    Split,
+)
+from envotate.typing import unpack_args
+
+SIZES = (10, 100, 1_000, 10_000)
+QUICK_SIZES = (10, 100)
+
+BASE_DIR = Path(__file__).parent.parent.absolute()
+DATA_DIR = BASE_DIR / "testapp" / "data" / "files"
+
+
+def upper(value: str) -> str:
+    return value.upper()
+
+
+def lower(value: str) -> str:
+    return value.lower()
+
+
+def make_schema(
+    size: int,
+    *,
+    name: str = "Schema",
+    bases: tuple[type, ...] = (),
+    prefix: str = "ATTR",
+) -> tuple[type, dict[str, str]]:
+    """Build a class with `size` annotated attributes of mixed types and the
+    environment needed to resolve it.
+    """
+    annotations: dict[str, Any] = {}
+    namespace: dict[str, Any] = {}
+    environ: dict[str, str] = {}
+    kinds = (
+        (int, "1"),
+        (str, "value"),
+        (bool, "true"),
+        (float, "1.5"),
+        (Optional[int], "2"),
+        (Literal["a", "b", "c"], "b"),
+        (Annotated[str, Regex(r"^v")], "value"),
+    )
+    for i in range(size):
+        attribute = f"{prefix}_{i}"
+        annotation, value = kinds[i % len(kinds)]
+        annotations[attribute] = annotation
+        if i % 5 == 0:
+            namespace[attribute] = value
+        else:
+            environ[attribute] = value
+
+    namespace.update({"__annotations__": annotations, "__module__": __name__})
+
+    return type(name, bases, namespace), environ
+
+
+def make_deep_schema(depth: int, width: int) -> tuple[type, dict[str, str]]:
+    cls: Optional[type] = None
+    environ: dict[str, str] = {}
+    for level in range(depth):
+        bases = (cls,) if cls is not None else ()
+        cls, level_environ = make_schema(
+            width, name=f"Level{level}", bases=bases, prefix=f"L{level}"
+        )
+        environ.update(level_environ)
+
+    return cls, environ  # type: ignore[return-value]
+
+
+def make_nested_schema(sections: int, width: int) -> tuple[type, dict[str, str]]:
+    annotations: dict[str, Any] = {}
+    environ: dict[str, str] = {}
+    for i in range(sections):
+        section, section_environ = make_schema(
+            width, name=f"Section{i}", prefix=f"S{i}"
+        )
+        annotations[f"SECTION_{i}"] = section
+        environ.update(section_environ)
+
+    namespace = {"__annotations__": annotations, "__module__": __name__}
+
+    return type("Nested", (), namespace), environ
+
+
+def make_chain_schema(length: int) -> tuple[type, dict[str, str]]:
+    chain: list[Any] = []
+    for _ in range(length):
+        chain.extend([Regex(r"^[a-z,]+$"), Function(upper), Function(lower)])
+    chain.extend([Split(), Choice(["a", "b", "c"])])
+    annotations = {"CHAIN": Annotated[tuple([list[str], *chain])]}  # type: ignore
+    namespace = {"__annotations__": annotations, "__module__": __name__}
+
+    return type("Chain", (), namespace), {"CHAIN": "a,b,c"}
+
+
+def fresh(factory: Callable[[], tuple[type, dict[str, str]]]) -> Callable[[], Any]:
+    """Decorate a newly built class on each call so the compiled plan is not reused."""
+
+    def run() -> Any:
+        cls, environ = factory()
+        return envotate(environ=environ)(cls)
+
+    return run
+
+
+def warm(factory: Callable[[], tuple[type, dict[str, str]]]) -> Callable[[], Any]:
+    """Resolve the same class on each call, reusing its compiled plan."""
+    cls, environ = factory()
+    resolver = Resolver(prefix=None, aliases=None, export=None)
+    list(resolver.resolve(cls, environ=environ))
+
+    def run() -> Any:
+        return list(resolver.resolve(cls, environ=environ))
+
+    return run
+
+
+class MethodContext:
+    @classmethod
+    def make(cls, value: str) -> str:
+        return value
+
+
+def collect(sizes: tuple[int, ...]) -> dict[str, Callable[[], Any]]:
+    benchmarks: dict[str, Callable[[], Any]] = {}
+
+    for size in sizes:
+        benchmarks[f"envotate/flat/{size}"] = fresh(lambda size=size: make_schema(size))
+        benchmarks[f"resolve/flat/{size}"] = warm(lambda size=size: make_schema(size))
+
+    benchmarks["envotate/deep/50x10"] = fresh(lambda: make_deep_schema(50, 10))
+    benchmarks["resolve/deep/50x10"] = warm(lambda: make_deep_schema(50, 10))
+    benchmarks["envotate/nested/100x10"] = fresh(lambda: make_nested_schema(100, 10))
+    benchmarks["envotate/chain/32"] = fresh(lambda: make_chain_schema(10))
+    benchmarks["resolve/chain/32"] = warm(lambda: make_chain_schema(10))
+
+    cls, environ = make_schema(10)
+    resolver = Resolver(prefix=None, aliases=None, export=None)
+    entry = resolver.compile(cls).entries[1]
+    benchmarks["get/str"] = lambda: resolver.get(entry, None, environ)
+
+    annotations = {
+        "int": int,
+        "optional": Optional[int],
+        "union": Union[bytes, str, None],
+        "literal": Literal["a", "b", "c"],
+        "annotated": Annotated[list[str], Split(), Choice(["a"])],
+    }
+    for name, annotation in annotations.items():
+        benchmarks[f"envotation/{name}"] = lambda a=annotation: Envotation(a, "path")
+        benchmarks[f"unpack_args/{name}"] = lambda a=annotation: unpack_args(a)
+
+    pattern = re.compile(r"^(prod|staging|dev)$")
+    types: dict[str, Callable[[], Any]] = {
+        "Choice": lambda: Choice(["a", "b", "c"]).apply(["a", "c"]),
+        "Directory": lambda: Directory(str(BASE_DIR)).apply("testapp"),
+        "DjangoDSN": lambda: DjangoDSN().apply("postgres://u:p@localhost:5432/db"),
+        "File": lambda: File(str(DATA_DIR)).apply("file.txt"),
+        "Function": lambda: Function(upper).apply("value"),
+        "Method": lambda: Method("make").apply("value", MethodContext),
+        "Regex/str": lambda: Regex(r"^(prod|staging|dev)$").apply("dev"),
+        "Regex/compiled": lambda: Regex(pattern).apply("dev"),
+        "Split": lambda: Split().apply("a,b,c,d"),
+    }
+    for name, func in types.items():
+        benchmarks[f"types/{name}"] = func
+
+    return benchmarks
+
+
+def measure(func: Callable[[], Any], budget: float = 0.2) -> dict[str, float]:
+    """Return the best time per call in seconds and the peak memory of a call."""
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    repeat = max(1, min(5, int(budget / max(elapsed, 1e-9))))
+    seconds = min([elapsed, *timer.repeat(repeat=repeat, number=number)]) / number
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": seconds, "peak_kib": peak / 1024}
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{unit}"
+
+    return f"{seconds / 1e-9:.0f}ns"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", help="Only run benchmarks matching a regex.")
+    parser.add_argument("--quick", action="store_true", help="Skip the large schemas.")
+    parser.add_argument("--save", type=Path, help="Write the results to a file.")
+    parser.add_argument("--compare", type=Path, help="Compare with a baseline file.")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    baseline: dict[str, dict[str, float]] = {}
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+
+    results: dict[str, dict[str, float]] = {}
+    regressions = []
+    benchmarks = collect(QUICK_SIZES if args.quick else SIZES)
+    for name, func in benchmarks.items():
+        if args.filter and not re.search(args.filter, name):
+            continue
+        result = results[name] = measure(func)
+        line = (
+            f"{name:<28} {format_seconds(result['seconds']):>10} "
+            f"{result['peak_kib']:>10.1f}KiB"
+        )
+        if name in baseline:
+            ratio = result["seconds"] / baseline[name]["seconds"]
+            line += f" {ratio:>6.2f}x"
+            if ratio > args.threshold:
+                regressions.append(name)
+                line += " REGRESSION"
+        print(line)
+
+    if args.save:
+        args.save.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
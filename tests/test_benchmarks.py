@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from tests.benchmarks.bench_resolver import QUICK_SIZES, collect
+
+
+def test_benchmarks_run():
+    """Run each benchmark once so that the suite keeps up with the API."""
+    for func in collect(QUICK_SIZES).values():
+        func()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from array import array
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Annotated, Literal, Optional, Union
+
+import pytest
+
+from envotate import Envotation, envotate
+from envotate.casters import INVALID, cast, casters, register
+from envotate.errors import AnnotationError
+from envotate.types import Items, Split
+
+
+class Port(int):
+    pass
+
+
+@pytest.mark.parametrize(
+    "type_, value, expected",
+    [
+        (int, "42", 42),
+        (int, " -7 ", -7),
+        (int, "1_000", 1000),
+        (int, "1.5", INVALID),
+        (int, "", INVALID),
+        (float, "1.5", 1.5),
+        (float, "1e3", 1000.0),
+        (float, "inf", float("inf")),
+        (float, "one", INVALID),
+        (bool, " TRUE ", True),
+        (bool, "No", False),
+        (bool, "2", INVALID),
+        (Decimal, "0.10", Decimal("0.10")),
+        (Decimal, "ten", INVALID),
+        (bytes, "value", b"value"),
+        (str, 1, "1"),
+        (
+            datetime,
+            "2024-01-02T03:04:05Z",
+            datetime(2024, 1, 2, 3, 4, 5, 0, timezone.utc),
+        ),
+        (datetime, "yesterday", INVALID),
+        (date, "2024-01-02", date(2024, 1, 2)),
+        (time, "03:04", time(3, 4)),
+        (timedelta, "90", timedelta(seconds=90)),
+        (timedelta, "1 day, 2:30:00", timedelta(days=1, hours=2, minutes=30)),
+        (timedelta, "PT1H30M", timedelta(hours=1, minutes=30)),
+        (timedelta, "P1W", timedelta(weeks=1)),
+        (timedelta, "P", INVALID),
+        (timedelta, "soon", INVALID),
+        (Path, "/tmp", Path("/tmp")),
+    ],
+)
+def test_cast(type_, value, expected):
+    assert cast(type_, value) == expected or cast(type_, value) is expected
+
+
+def test_register_caster(monkeypatch):
+    monkeypatch.setattr("envotate.casters.casters", dict(casters))
+
+    @register(Port)
+    def cast_port(value):
+        port = cast(int, value)
+        return Port(port) if port is not INVALID and 0 < port < 65536 else INVALID
+
+    assert cast(Port, "8080") == 8080
+    assert cast(Port, "0") is INVALID
+    assert cast(Port, Port(80)) == 80
+
+    @envotate(environ={"PORT": "8080"})
+    class PortSettings:
+        PORT: Port
+
+    assert PortSettings.PORT == 8080
+    with pytest.raises(AnnotationError):
+
+        @envotate(environ={"PORT": "99999"})
+        class BadPortSettings:
+            PORT: Port
+
+
+def test_union_dispatch_is_precomputed():
+    envotation = Envotation(Union[int, float, None], "VALUE")
+    assert envotation.dispatch == (int, float)
+    assert envotation.cast("1") == 1
+    assert envotation.cast("1.5") == 1.5
+    assert envotation.cast(2.5) == 2.5
+    with pytest.raises(AnnotationError) as excinfo:
+        envotation.cast("one")
+    assert excinfo.match("could not be cast to any of int, float")
+
+    assert Envotation(Union[Literal["a"], None], "VALUE").dispatch == ()
+
+    @envotate(environ={"PORT": "8080", "RATIO": "0.5", "NAME": "app", "DEBUG": "Yes"})
+    class UnionSettings:
+        PORT: Optional[int]
+        RATIO: Union[int, float]
+        NAME: Union[int, str]
+        VERSION: Union[int, str] = "1"
+        DEBUG: bool
+        MISSING: Optional[int]
+
+    assert UnionSettings.PORT == 8080
+    assert UnionSettings.RATIO == 0.5
+    assert UnionSettings.NAME == "app"
+    # A value that already has one of the types is kept.
+    assert UnionSettings.VERSION == "1"
+    assert UnionSettings.DEBUG is True
+    assert UnionSettings.MISSING is None
+
+
+def test_collections():
+    environ = {
+        "IDS": "1, 2,3",
+        "PORTS": "80,443",
+        "HOSTS": "a,b,a",
+        "NAMES": "x;y",
+        "PAIR": "host,8080",
+        "LIMITS": "a=1, b=2",
+        "EMPTY": "",
+        "FLOATS": "0.5,1.5",
+        "LAZY": "1,2,3",
+        "SPLIT": "1,2",
+    }
+
+    @envotate(environ=environ)
+    class CollectionSettings:
+        IDS: list[int]
+        PORTS: tuple[int, ...]
+        HOSTS: set[str]
+        NAMES: Annotated[frozenset[str], Items(delimiter=";")]
+        PAIR: tuple[str, int]
+        LIMITS: dict[str, int]
+        EMPTY: list[int]
+        FLOATS: Annotated[list[float], Items(compact=True)]
+        LAZY: Annotated[list[int], Items(lazy=True)]
+        SPLIT: Annotated[list[int], Split()]
+        DEFAULT: list[int] = [1, "2"]
+        COMPACT: Annotated[set[str], Items(compact=True)] = "a,b"
+
+    assert CollectionSettings.IDS == [1, 2, 3]
+    assert CollectionSettings.PORTS == (80, 443)
+    assert CollectionSettings.HOSTS == {"a", "b"}
+    assert CollectionSettings.NAMES == frozenset({"x", "y"})
+    assert CollectionSettings.PAIR == ("host", 8080)
+    assert CollectionSettings.LIMITS == {"a": 1, "b": 2}
+    assert CollectionSettings.EMPTY == []
+    assert CollectionSettings.FLOATS == array("d", [0.5, 1.5])
+    assert list(CollectionSettings.LAZY) == list(CollectionSettings.LAZY) == [1, 2, 3]
+    assert CollectionSettings.SPLIT == [1, 2]
+    assert CollectionSettings.DEFAULT == [1, 2]
+    assert CollectionSettings.COMPACT == frozenset({"a", "b"})
+
+    for annotation, value in [
+        (list[int], "1,x"),
+        (tuple[str, int], "a,b"),
+        (tuple[str, int], "a"),
+        (dict[str, int], "a"),
+        (dict[str, int], "a=b"),
+        (dict, [1, 2]),
+        (list, {"a": 1}),
+        (set[str], {"a": 1}),
+    ]:
+        with pytest.raises(AnnotationError):
+            Envotation(annotation, "VALUE").cast(value)
+
+    @envotate(environ={"IDS": "1,2,3", "LIMITS": "a=1", "NAMES": "x,y"})
+    class OptionalCollectionSettings:
+        IDS: Optional[list[int]]
+        LIMITS: Optional[dict[str, int]]
+        NAMES: Optional[list[str]]
+        PORTS: Union[int, list[int]] = "80,443"
+        MISSING: Optional[list[int]]
+
+    assert OptionalCollectionSettings.IDS == [1, 2, 3]
+    assert OptionalCollectionSettings.LIMITS == {"a": 1}
+    assert OptionalCollectionSettings.NAMES == ["x", "y"]
+    assert OptionalCollectionSettings.PORTS == [80, 443]
+    assert OptionalCollectionSettings.MISSING is None
+    with pytest.raises(AnnotationError):
+        Envotation(Optional[list[int]], "VALUE").cast("1,x")
+
+    lazy = Envotation(Annotated[list[int], Items(lazy=True)], "VALUE").cast("1,x")
+    with pytest.raises(ValueError):
+        list(lazy)
@@ -2,13 +2,40 @@
 # flake8: noqa
 from __future__ import annotations
 
+import asyncio
+import gc
+import inspect
+import os
+import stat
+import subprocess
 import sys
-from typing import Literal, Optional, Union
+import threading
+import time
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Literal, Optional, Union
 
 import pytest
 
-from envotate import FALSEY, TRUTHY, envotate
-from envotate.errors import AnnotationError, VariableError
+from envotate import (
+    FALSEY,
+    TRUTHY,
+    LazyAttribute,
+    Resolver,
+    aresolve,
+    cache,
+    envotate,
+    instantiate,
+    preload,
+    reload,
+    resolve_many,
+    snapshot,
+    validate,
+)
+from envotate.errors import AnnotationError, ValidationError, VariableError
+from envotate.trie import Trie
+from envotate.types import Function, Method
 
 
 class Database:
@@ -289,3 +316,841 @@ def test_load_from_environment_using_prefix_and_aliases(export_to_module):
     assert Settings.DATABASE.HOSTNAME == "localhost"
     assert Settings.DATABASE.PORT == 5432
     assert Settings.DATABASE.NAME == "local_db"
+
+
+def test_compiled_plan_is_reused(monkeypatch):
+    resolver = Resolver(prefix="APP", aliases={"DEBUG": "DBG"}, export=None)
+    plan = resolver.compile(Settings)
+
+    def get_type_hints(*args, **kwargs):
+        raise AssertionError("Annotations should not be evaluated again.")
+
+    monkeypatch.setattr("envotate.get_type_hints", get_type_hints)
+
+    assert resolver.compile(Settings) is plan
+    assert [(entry.attribute, entry.key) for entry in plan.entries] == [
+        ("APP_ID", "APP_APP_ID"),
+        ("APP_ENV", "APP_APP_ENV"),
+        ("APP_VERSION", "APP_APP_VERSION"),
+        ("DEBUG", "APP_DBG"),
+        ("DATABASE", "APP_DATABASE"),
+    ]
+    assert plan.entries[-1].section is Database
+    assert plan.entries[-1].envotation is None
+
+
+def test_compiled_plan_does_not_keep_class_alive():
+    @envotate(environ={"APP_ID": "1"})
+    class LocalSettings:
+        APP_ID: int
+
+    ref = weakref.ref(LocalSettings)
+    del LocalSettings
+    gc.collect()
+    assert ref() is None
+
+
+def test_compiled_plan_persisted_to_cache_dir(monkeypatch, tmp_path):
+    resolver = Resolver(prefix=None, aliases=None, export=None, cache_dir=tmp_path)
+    vars(Settings).get("__envotate_plans__", {}).clear()
+    plan = resolver.compile(Settings)
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+
+    def get_type_hints(*args, **kwargs):
+        raise AssertionError("Annotations should be loaded from the cache.")
+
+    with monkeypatch.context() as m:
+        m.setattr("envotate.get_type_hints", get_type_hints)
+        Settings.__envotate_plans__.clear()
+        loaded = resolver.compile(Settings)
+
+    assert loaded is not plan
+    assert loaded.cls is Settings
+    assert [entry.key for entry in loaded.entries] == [
+        entry.key for entry in plan.entries
+    ]
+
+    @envotate(cache_dir=tmp_path)
+    class LocalSettings:
+        APP_ID: int
+
+    assert LocalSettings.APP_ID == 2
+    # The plan does not refer to the class, so even a local class can be persisted.
+    assert len(list(tmp_path.glob("*.pickle"))) == 2
+
+
+def test_cache_dump_with_concurrent_writers(tmp_path):
+    script = (
+        "import sys\n"
+        "from envotate import cache\n"
+        "\n"
+        "print(all(\n"
+        "    cache.dump(sys.argv[1], 'settings', '0' * 16, {'APP_ID': 1})\n"
+        "    for _ in range(200)\n"
+        "))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": root}
+    writers = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, str(tmp_path)],
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for _ in range(4)
+    ]
+    assert [writer.communicate()[0].split() for writer in writers] == [["True"]] * 4
+    assert cache.load(tmp_path, "settings", "0" * 16) == {"APP_ID": 1}
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # A directory that cannot be written to skips the cache.
+    (tmp_path / "file").write_text("")
+    assert cache.dump(tmp_path / "file", "settings", "0" * 16, {}) is False
+
+
+def test_decorated_plan_persisted_across_processes(tmp_path):
+    (tmp_path / "cachedtypes.py").write_text(
+        "from typing import Annotated\n"
+        "from envotate.types import Choice\n"
+        "\n"
+        "AppId = Annotated[int, Choice(['1', '2'])]\n"
+    )
+    (tmp_path / "cachedsettings.py").write_text(
+        "from envotate import envotate\n"
+        "from cachedtypes import AppId\n"
+        "\n"
+        f"@envotate(cache_dir={str(tmp_path / 'cache')!r})\n"
+        "class Settings:\n"
+        "    APP_ID: AppId\n"
+        "    DEBUG: bool = False\n"
+    )
+    (tmp_path / "main.py").write_text(
+        "import sys\n"
+        "import envotate\n"
+        "\n"
+        "def get_type_hints(*args, **kwargs):\n"
+        "    raise AssertionError('Annotations should be loaded from the cache.')\n"
+        "\n"
+        "if sys.argv[1:] == ['cached']:\n"
+        "    envotate.get_type_hints = get_type_hints\n"
+        "\n"
+        "import cachedsettings\n"
+        "\n"
+        "print(cachedsettings.Settings.APP_ID, cachedsettings.Settings.DEBUG)\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(tmp_path), root])}
+    for args in ([], ["cached"]):
+        result = subprocess.run(
+            [sys.executable, str(tmp_path / "main.py"), *args],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["2", "True"]
+        assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+
+    # A change to an imported annotation is not hidden by the cached plan.
+    (tmp_path / "cachedtypes.py").write_text(
+        "from typing import Annotated\n"
+        "from envotate.types import Choice\n"
+        "\n"
+        "AppId = Annotated[int, Choice(['3'])]\n"
+    )
+    result = subprocess.run(
+        [sys.executable, str(tmp_path / "main.py")],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode != 0
+    assert "APP_ID" in result.stderr
+
+
+def test_resolved_values_persisted_to_cache_dir(
+    monkeypatch, tmp_path, export_to_module
+):
+    calls = []
+
+    def fetch(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    export_to_module(fetch, module=__name__)
+
+    def make_settings():
+        class ValuesDatabase:
+            DB_HOST: Annotated[str, Function(fetch)]
+            DB_PORT: int = 5432
+
+        export_to_module(ValuesDatabase)
+
+        class ValuesSettings:
+            APP_ID: int
+            APP_ENV: Annotated[str, Function(fetch)] = "local"
+            DATABASE: ValuesDatabase
+
+        return envotate(cache_dir=tmp_path / "cache", cache_values=True)(ValuesSettings)
+
+    first = make_settings()
+    assert calls == ["dev", "localhost"]
+    (values,) = (tmp_path / "cache").glob("*.values.*.pickle")
+    assert stat.S_IMODE(values.stat().st_mode) == 0o600
+    assert stat.S_IMODE((tmp_path / "cache").stat().st_mode) == 0o700
+
+    second = make_settings()
+    assert calls == ["dev", "localhost"]
+    assert second.APP_ID == first.APP_ID == 2
+    assert second.APP_ENV == "DEV"
+    assert second.DATABASE.DB_HOST == "LOCALHOST"
+    assert second.DATABASE.DB_PORT == 5432
+    assert second.__envotations__ == {"APP_ID", "APP_ENV", "DATABASE"}
+    assert second.DATABASE.__envotations__ == {"DB_HOST", "DB_PORT"}
+
+    # The restored classes can be reloaded.
+    monkeypatch.setenv("DB_HOST", "remote")
+    path = f"{second.__qualname__}.DB_HOST"
+    assert reload(second) == {path: ("LOCALHOST", "REMOTE")}
+
+    # A change to the environment falls back to resolving the values.
+    third = make_settings()
+    assert calls == ["dev", "localhost", "remote", "dev", "remote"]
+    assert third.DATABASE.DB_HOST == "REMOTE"
+
+
+def test_instantiate_frozen_records(monkeypatch, export_to_module):
+    class RecordDatabase:
+        DB_HOST: str = "localhost"
+        DB_PORT: int = 5432
+
+    export_to_module(RecordDatabase)
+
+    class RecordSettings(Settings):
+        URL: Annotated[str, Method("make_url")] = ""
+        DATABASE: RecordDatabase
+
+        @classmethod
+        def make_url(cls) -> str:
+            return f"https://{cls.DATABASE.DB_HOST}/{cls.APP_ENV}"
+
+    settings = instantiate(RecordSettings)
+    other = instantiate(RecordSettings, environ={"APP_ID": "3", "DB_HOST": "remote"})
+    assert settings.APP_ID == 2
+    assert settings.DATABASE.DB_PORT == 5432
+    assert settings.URL == "https://localhost/dev"
+    assert other.APP_ID == 3
+    assert other.URL == "https://remote/local"
+    assert type(other) is type(settings)
+    assert type(other.DATABASE) is type(settings.DATABASE)
+    assert other != settings
+    assert instantiate(RecordSettings) == settings
+    assert settings.asdict()["DATABASE"] == {"DB_HOST": "localhost", "DB_PORT": 5432}
+    assert repr(settings.DATABASE) == (
+        f"{RecordDatabase.__qualname__}(DB_HOST='localhost', DB_PORT=5432)"
+    )
+
+    # The classes are not modified and the records are frozen and slotted.
+    assert "APP_ID" not in vars(RecordSettings)
+    assert not hasattr(RecordSettings, "__envotations__")
+    assert not hasattr(RecordDatabase, "__envotations__")
+    assert not hasattr(settings, "__dict__")
+    with pytest.raises(AttributeError):
+        settings.APP_ID = 4
+    with pytest.raises(AttributeError):
+        del settings.DATABASE
+
+    with pytest.raises(AnnotationError, match="APP_ID"):
+        instantiate(RecordSettings, environ={"APP_ID": "invalid"})
+
+
+def test_resolve_many_environments(export_to_module):
+    calls = []
+
+    def parse(value: str) -> tuple[str, ...]:
+        calls.append(value)
+        return tuple(value.split(","))
+
+    export_to_module(parse, module=__name__)
+
+    class TenantDatabase:
+        DB_HOST: str = "localhost"
+
+    export_to_module(TenantDatabase)
+
+    class TenantSettings:
+        TENANT_ID: int
+        HOSTS: Annotated[tuple, Function(parse)]
+        DATABASE: TenantDatabase
+        URL: Annotated[str, Method("make_url")] = ""
+
+        @classmethod
+        def make_url(cls) -> str:
+            return f"https://{cls.DATABASE.DB_HOST}/{cls.TENANT_ID}"
+
+    envs = (
+        {"TENANT_ID": str(i), "HOSTS": "a,b" if i % 2 else "c"} for i in range(1, 5)
+    )
+    results = resolve_many(TenantSettings, envs)
+    assert inspect.isgenerator(results)
+
+    first, *rest = results
+    assert [result.TENANT_ID for result in [first, *rest]] == [1, 2, 3, 4]
+    assert [result.URL for result in rest] == [
+        "https://localhost/2",
+        "https://localhost/3",
+        "https://localhost/4",
+    ]
+    assert calls == ["a,b", "c"]
+    assert rest[1].HOSTS is first.HOSTS == ("a", "b")
+    assert rest[0].DATABASE is first.DATABASE
+    assert "TENANT_ID" not in vars(TenantSettings)
+
+    envs = [{"TENANT_ID": "1", "HOSTS": "a"}, {"HOSTS": "a"}, {"TENANT_ID": "x"}]
+    results = list(resolve_many(TenantSettings, envs, raise_errors=False))
+    assert results[0].TENANT_ID == 1
+    assert [key for _, key, _ in results[1].errors] == ["TENANT_ID", "URL"]
+    assert [key for _, key, _ in results[2].errors] == ["TENANT_ID", "HOSTS", "URL"]
+
+    with pytest.raises(ValidationError):
+        list(resolve_many(TenantSettings, envs))
+
+
+def test_lazy_resolution_on_first_access(monkeypatch, export_to_module):
+    calls = []
+
+    def make_value(value: str) -> str:
+        calls.append(value)
+        time.sleep(0.01)
+        return value.upper()
+
+    export_to_module(make_value, module=__name__)
+
+    class LazyDatabase:
+        DB_HOST: str
+        DB_PORT: int
+
+    export_to_module(LazyDatabase)
+
+    @envotate(lazy=True)
+    class LazySettings(Settings):
+        APP_ENV: Annotated[str, Function(make_value)]
+        MISSING: str
+        DATABASE: LazyDatabase
+
+    assert LazySettings.__envotations__ == {
+        "APP_ID",
+        "APP_ENV",
+        "APP_VERSION",
+        "DEBUG",
+        "DATABASE",
+        "MISSING",
+    }
+    assert isinstance(vars(LazySettings)["APP_ENV"], LazyAttribute)
+    assert not calls
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: LazySettings.APP_ENV, range(8)))
+
+    assert results == ["DEV"] * 8
+    assert calls == ["dev"]
+    assert vars(LazySettings)["APP_ENV"] == "DEV"
+
+    assert LazySettings.DATABASE is LazyDatabase
+    assert isinstance(vars(LazyDatabase)["DB_PORT"], LazyAttribute)
+    assert LazySettings.DATABASE.DB_PORT == 5432
+
+    with pytest.raises(VariableError) as excinfo:
+        LazySettings.MISSING
+    assert excinfo.match("MISSING")
+
+    monkeypatch.setenv("MISSING", "found")
+    assert reload(LazySettings) == {}
+    preload(LazySettings)
+    assert vars(LazySettings)["MISSING"] == "found"
+    assert vars(LazyDatabase)["DB_HOST"] == "localhost"
+    assert not any(
+        isinstance(value, LazyAttribute)
+        for cls in (LazySettings, LazyDatabase)
+        for value in vars(cls).values()
+    )
+
+
+def test_reload_only_changed_variables(monkeypatch, export_to_module):
+    calls = []
+
+    def make_value(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    export_to_module(make_value, module=__name__)
+
+    class ReloadDatabase:
+        DB_HOST: str
+        DB_PORT: int
+
+    export_to_module(ReloadDatabase)
+
+    @envotate
+    class ReloadSettings(Settings):
+        APP_ENV: Annotated[str, Function(make_value)]
+        DATABASE: ReloadDatabase
+
+    assert calls == ["dev"]
+    assert reload(ReloadSettings) == {}
+
+    monkeypatch.setenv("APP_ID", "3")
+    monkeypatch.setenv("DB_PORT", "5433")
+    monkeypatch.setenv("DB_HOST", "localhost")
+    monkeypatch.delenv("DEBUG")
+
+    assert reload(ReloadSettings) == {
+        "APP_ID": (2, 3),
+        "DEBUG": (True, False),
+        f"{ReloadSettings.__qualname__}.DB_PORT": (5432, 5433),
+    }
+    assert ReloadSettings.APP_ID == 3
+    assert ReloadSettings.DEBUG is False
+    assert ReloadSettings.DATABASE.DB_PORT == 5433
+    assert ReloadSettings.APP_ENV == "DEV"
+    assert calls == ["dev"]
+
+    monkeypatch.setenv("APP_ID", "4")
+    monkeypatch.setenv("APP_ENV", "prod")
+    monkeypatch.setenv("DB_PORT", "invalid")
+    with pytest.raises(AnnotationError) as excinfo:
+        reload(ReloadSettings)
+    assert excinfo.match("DB_PORT")
+
+    assert ReloadSettings.APP_ID == 3
+    assert ReloadSettings.APP_ENV == "DEV"
+
+    # A nested section is left untouched by an invalid variable of its parent.
+    monkeypatch.setenv("DB_PORT", "5433")
+    monkeypatch.setenv("DB_HOST", "remote")
+    monkeypatch.setenv("APP_ID", "invalid")
+    with pytest.raises(AnnotationError, match="APP_ID"):
+        reload(ReloadSettings)
+    assert ReloadSettings.DATABASE.DB_HOST == "localhost"
+    assert reload(ReloadSettings.DATABASE) != {}
+
+    monkeypatch.setenv("DB_HOST", "localhost")
+    reload(ReloadSettings.DATABASE)
+    monkeypatch.setenv("APP_ID", "4")
+    assert reload(ReloadSettings) == {"APP_ID": (3, 4), "APP_ENV": ("DEV", "PROD")}
+    assert calls == ["dev", "prod", "prod"]
+
+    class Undecorated:
+        APP_ID: int
+
+    with pytest.raises(TypeError) as excinfo:
+        reload(Undecorated)
+    assert excinfo.match("has not been configured")
+
+
+def test_reload_lazy_attributes(monkeypatch):
+    @envotate(lazy=True)
+    class LazySettings:
+        APP_ID: int
+        APP_ENV: str
+
+    assert reload(LazySettings) == {}
+    assert LazySettings.APP_ID == 2
+
+    monkeypatch.setenv("APP_ID", "3")
+    monkeypatch.setenv("APP_ENV", "prod")
+    assert reload(LazySettings) == {"APP_ID": (2, 3)}
+    assert isinstance(vars(LazySettings)["APP_ENV"], LazyAttribute)
+    assert LazySettings.APP_ENV == "prod"
+
+
+def test_resolve_from_environment_snapshot(monkeypatch, export_to_module):
+    environ = {"APP_ID": "10", "DEBUG": "no", "DB_PORT": "6543"}
+
+    class SnapshotDatabase:
+        DB_PORT: int = 5432
+
+    export_to_module(SnapshotDatabase)
+
+    @envotate(environ=environ)
+    class SnapshotSettings(Settings):
+        DATABASE: SnapshotDatabase
+
+    assert SnapshotSettings.APP_ID == 10
+    assert SnapshotSettings.APP_ENV == "local"
+    assert SnapshotSettings.DEBUG is False
+    assert SnapshotSettings.DATABASE.DB_PORT == 6543
+
+    @envotate(lazy=True)
+    class LazySnapshotSettings:
+        APP_ID: int
+
+    monkeypatch.setenv("APP_ID", "3")
+    assert LazySnapshotSettings.APP_ID == 2
+
+    environ = snapshot()
+    assert environ["APP_ID"] == "3"
+    assert snapshot(environ) is environ
+    with pytest.raises(TypeError):
+        environ["APP_ID"] = "4"
+
+    assert reload(SnapshotSettings, {"APP_ID": "11"}) == {
+        "APP_ID": (10, 11),
+        f"{SnapshotSettings.__qualname__}.DB_PORT": (6543, 5432),
+    }
+
+
+def test_validate_collects_every_error(monkeypatch, export_to_module):
+    monkeypatch.setenv("APP_ID", "invalid")
+    monkeypatch.setenv("DEBUG", "maybe")
+    monkeypatch.setenv("DB_PORT", "invalid")
+
+    class ValidateDatabase:
+        DB_HOST: str
+        DB_PORT: int
+        DB_TIMEOUT: int
+
+    export_to_module(ValidateDatabase)
+
+    class ValidateSettings(Settings):
+        APP_ENV: Literal["prod", "staging"]
+        DATABASE: ValidateDatabase
+        URL: Annotated[str, Method("make_url")] = ""
+
+        @classmethod
+        def make_url(cls) -> str:
+            return f"https://{cls.DATABASE.DB_HOST}/{cls.APP_VERSION}"
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate(ValidateSettings)
+
+    qualname = ValidateSettings.__qualname__
+    assert [(path, key) for path, key, _ in excinfo.value.errors] == [
+        ("APP_ID", "APP_ID"),
+        ("APP_ENV", "APP_ENV"),
+        ("DEBUG", "DEBUG"),
+        (f"{qualname}.DB_PORT", "DB_PORT"),
+        (f"{qualname}.DB_TIMEOUT", "DB_TIMEOUT"),
+    ]
+    assert excinfo.match("5 variable")
+    assert excinfo.match(r"DB_TIMEOUT \[DB_TIMEOUT\]: '.+' is required")
+    assert "__envotations__" not in vars(ValidateSettings)
+    assert "__envotations__" not in vars(ValidateDatabase)
+    assert ValidateSettings.URL == ""
+
+    monkeypatch.setenv("PREFIX_APP_ID", "1")
+    errors = validate(ValidateSettings, prefix="PREFIX", raise_errors=False)
+    assert [key for _, key, _ in errors] == [
+        "PREFIX_APP_ENV",
+        "PREFIX_DB_HOST",
+        "PREFIX_DB_PORT",
+        "PREFIX_DB_TIMEOUT",
+        "PREFIX_URL",
+    ]
+    assert "AttributeError" in str(errors[-1][2])
+
+    environ = {
+        "APP_ID": "1",
+        "APP_ENV": "prod",
+        "DB_HOST": "db",
+        "DB_PORT": "1",
+        "DB_TIMEOUT": "1",
+    }
+    assert validate(ValidateSettings, environ=environ) == []
+
+    @envotate(environ=environ)
+    class ValidSettings(ValidateSettings):
+        pass
+
+    assert ValidSettings.URL == "https://db/0.1.0"
+    errors = validate(ValidSettings, raise_errors=False)
+    assert [key for _, key, _ in errors] == [
+        "APP_ID",
+        "APP_ENV",
+        "DEBUG",
+        "DB_PORT",
+        "DB_TIMEOUT",
+    ]
+    assert ValidSettings.APP_ID == 1
+
+
+def test_async_resolution(monkeypatch, export_to_module):
+    events = []
+
+    async def fetch(value: str) -> str:
+        events.append(("start", value))
+        await asyncio.sleep(0.01)
+        events.append(("end", value))
+        return value.upper()
+
+    export_to_module(fetch, module=__name__)
+
+    class AsyncDatabase:
+        DB_HOST: Annotated[str, Function(fetch)]
+
+    export_to_module(AsyncDatabase)
+
+    class AsyncSettings(Settings):
+        APP_ENV: Annotated[str, Function(fetch)]
+        URL: Annotated[str, Method("make_url")] = ""
+        DATABASE: AsyncDatabase
+
+        @classmethod
+        async def make_url(cls) -> str:
+            return f"https://{cls.DATABASE.DB_HOST}/{cls.APP_ENV}"
+
+    assert asyncio.run(aresolve(AsyncSettings)) is AsyncSettings
+    assert events[:2] == [("start", "dev"), ("start", "localhost")]
+    assert AsyncSettings.APP_ID == 2
+    assert AsyncSettings.APP_ENV == "DEV"
+    assert AsyncSettings.DATABASE.DB_HOST == "LOCALHOST"
+    assert AsyncSettings.URL == "https://LOCALHOST/DEV"
+    assert AsyncSettings.__envotations__ == {
+        "APP_ID",
+        "APP_ENV",
+        "APP_VERSION",
+        "DEBUG",
+        "DATABASE",
+        "URL",
+    }
+
+    monkeypatch.setenv("APP_ID", "invalid")
+    monkeypatch.setenv("DEBUG", "invalid")
+
+    class InvalidAsyncSettings(Settings):
+        pass
+
+    with pytest.raises(AnnotationError) as excinfo:
+        asyncio.run(aresolve(InvalidAsyncSettings))
+    assert excinfo.match("APP_ID")
+
+    # An async argument cannot be resolved synchronously, and is not left unawaited.
+    monkeypatch.setenv("APP_ID", "1")
+
+    class SyncSettings:
+        APP_ENV: Annotated[str, Function(fetch)]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(VariableError, match="aresolve"):
+            envotate(SyncSettings)
+        gc.collect()
+
+
+def test_parallel_resolution(monkeypatch, export_to_module):
+    events = []
+    # Every fetch waits until the four of them have started, so they must overlap.
+    barrier = threading.Barrier(4, timeout=5)
+
+    def fetch(value: str) -> str:
+        events.append(("start", value))
+        barrier.wait()
+        events.append(("end", value))
+        return value.upper()
+
+    export_to_module(fetch, module=__name__)
+    for key in ("A", "B", "C"):
+        monkeypatch.setenv(f"PARALLEL_{key}", key.lower())
+
+    class ParallelDatabase:
+        DB_HOST: Annotated[str, Function(fetch)]
+
+    export_to_module(ParallelDatabase)
+
+    class ParallelSettings(Settings):
+        PARALLEL_A: Annotated[str, Function(fetch)]
+        PARALLEL_B: Annotated[str, Function(fetch)]
+        PARALLEL_C: Annotated[str, Function(fetch)]
+        URL: Annotated[str, Method("make_url")] = ""
+        DATABASE: ParallelDatabase
+
+        @classmethod
+        def make_url(cls) -> str:
+            return f"https://{cls.DATABASE.DB_HOST}/{cls.PARALLEL_A}"
+
+    envotate(workers=4)(ParallelSettings)
+    assert [kind for kind, _ in events[:4]] == ["start"] * 4
+    assert ParallelSettings.PARALLEL_C == "C"
+    assert ParallelSettings.DATABASE.DB_HOST == "LOCALHOST"
+    assert ParallelSettings.URL == "https://LOCALHOST/A"
+
+    # Only the nested section fetches from here on.
+    barrier = threading.Barrier(1)
+
+    def fail(value: str) -> str:
+        time.sleep(0.05 if value == "a" else 0)
+        raise ValueError(value)
+
+    export_to_module(fail, module=__name__)
+
+    class InvalidParallelSettings:
+        PARALLEL_A: Annotated[str, Function(fail)]
+        PARALLEL_B: Annotated[str, Function(fail)]
+        PARALLEL_C: Annotated[str, Function(fail)]
+        DATABASE: ParallelDatabase
+
+    # The first error in declaration order is raised, regardless of timing.
+    with pytest.raises(VariableError, match="PARALLEL_A"):
+        envotate(workers=4)(InvalidParallelSettings)
+
+    events.clear()
+
+    class SmallSettings:
+        PARALLEL_A: Annotated[str, Function(fetch)]
+        PARALLEL_B: Annotated[str, Function(fetch)]
+
+    # Too few attributes would block for the thread pool to be used.
+    envotate(workers=4)(SmallSettings)
+    assert [kind for kind, _ in events] == ["start", "end"] * 2
+
+
+def test_shared_sections_resolved_once_per_prefix(export_to_module):
+    environ = {
+        "DB_HOST": "primary",
+        "REPLICA_DB_HOST": "replica",
+        "REPLICA_DB_PORT": "5433",
+        "REPLICA_CACHE_URL": "redis://replica",
+    }
+
+    @envotate(prefix="DB", environ=environ)
+    class SharedDatabase:
+        HOST: str = "localhost"
+        PORT: int = 5432
+
+    export_to_module(SharedDatabase)
+
+    class SharedCache:
+        CACHE_URL: str = "memory://"
+
+    export_to_module(SharedCache)
+
+    @envotate(environ=environ)
+    class PrimarySettings:
+        DATABASE: SharedDatabase
+        CACHE: SharedCache
+
+    assert PrimarySettings.DATABASE is SharedDatabase
+    assert PrimarySettings.CACHE is SharedCache
+    assert SharedCache.CACHE_URL == "memory://"
+
+    events = []
+
+    @envotate(prefix="REPLICA", environ=environ, hook=events.append)
+    class ReplicaSettings:
+        DATABASE: SharedDatabase
+        FALLBACK: SharedDatabase
+        CACHE: SharedCache
+
+    # The prefix of the decorated section is appended to the prefix of the parent.
+    replica = ReplicaSettings.DATABASE
+    assert replica is ReplicaSettings.FALLBACK
+    assert replica is not SharedDatabase
+    assert issubclass(replica, SharedDatabase)
+    assert (replica.HOST, replica.PORT) == ("replica", 5433)
+    assert (SharedDatabase.HOST, SharedDatabase.PORT) == ("primary", 5432)
+    assert ReplicaSettings.CACHE is not SharedCache
+    assert ReplicaSettings.CACHE.CACHE_URL == "redis://replica"
+    assert SharedCache.CACHE_URL == "memory://"
+    assert [event.path for event in events if event.kind == "section"] == [
+        "DATABASE",
+        "CACHE",
+    ]
+
+    @envotate(prefix="REPLICA", environ=environ)
+    class OtherReplicaSettings:
+        DATABASE: SharedDatabase
+
+    # Each resolution resolves its sections from its own environment.
+    assert OtherReplicaSettings.DATABASE is not replica
+    assert OtherReplicaSettings.DATABASE.HOST == "replica"
+
+    class TenantDatabase:
+        HOST: str = "localhost"
+
+    export_to_module(TenantDatabase)
+
+    @envotate(environ={"HOST": "tenant-a"})
+    class TenantA:
+        DATABASE: TenantDatabase
+
+    @envotate(environ={"HOST": "tenant-b"})
+    class TenantB:
+        DATABASE: TenantDatabase
+
+    assert TenantA.DATABASE.HOST == "tenant-a"
+    assert TenantB.DATABASE.HOST == "tenant-b"
+    assert TenantA.DATABASE is not TenantB.DATABASE
+
+    # A decorated section is only its own result for an equal environment.
+    @envotate(environ={"DB_HOST": "other"})
+    class OtherEnvironSettings:
+        DATABASE: SharedDatabase
+
+    assert OtherEnvironSettings.DATABASE is not SharedDatabase
+    assert OtherEnvironSettings.DATABASE.HOST == "other"
+    assert SharedDatabase.HOST == "primary"
+
+    errors = validate(ReplicaSettings, environ={}, raise_errors=False)
+    assert errors == []
+    assert Resolver("REPLICA", None, None).unknown(ReplicaSettings, environ) == []
+
+    replica_environ = {**environ, "REPLICA_DB_HOST": "standby"}
+    assert reload(ReplicaSettings, replica_environ) == {"HOST": ("replica", "standby")}
+    assert SharedDatabase.HOST == "primary"
+
+
+def test_strict_mode_reports_unknown_variables(export_to_module):
+    trie = Trie(["APP_ID", "APP_DB_HOST", "APPLE_ID", "APP", "OTHER"])
+    assert sorted(trie.find("APP")) == ["APP_DB_HOST", "APP_ID"]
+    assert sorted(trie.find("APP_DB")) == ["APP_DB_HOST"]
+    assert list(trie.find("MISSING")) == []
+
+    class StrictDatabase:
+        DB_HOST: str = "localhost"
+        DB_PORT: int = 5432
+
+    export_to_module(StrictDatabase)
+
+    class StrictSettings:
+        ID: int = 1
+        SECRET: str = ""
+        DATABASE: StrictDatabase
+
+    environ = {
+        "APP_ID": "2",
+        "APP_DB_PROT": "5433",
+        "APP_TOKEN": "secret",
+        "APPLE_ID": "3",
+        "KUBERNETES_SERVICE_HOST": "10.0.0.1",
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        envotate(prefix="APP", environ=environ, strict=True)(StrictSettings)
+
+    errors = excinfo.value.errors
+    assert [key for _, key, _ in errors] == ["APP_DB_PROT", "APP_TOKEN"]
+    assert excinfo.match("'APP_DB_PROT' does not match any attribute.")
+    assert excinfo.match("did you mean 'APP_DB_PORT'?")
+    assert "did you mean" not in str(errors[1][2])
+    assert StrictSettings.ID == 1
+    assert not hasattr(StrictSettings, "__envotations__")
+
+    errors = validate(
+        StrictSettings,
+        prefix="APP",
+        aliases={"SECRET": "TOKEN"},
+        environ=environ,
+        strict=True,
+        raise_errors=False,
+    )
+    assert [key for _, key, _ in errors] == ["APP_DB_PROT"]
+
+    del environ["APP_DB_PROT"], environ["APP_TOKEN"]
+    envotate(prefix="APP", environ=environ, strict=True)(StrictSettings)
+    assert StrictSettings.ID == 2
+
+    class NoPrefixSettings:
+        ID: int = 1
+
+    with pytest.raises(ValueError):
+        envotate(environ=environ, strict=True)(NoPrefixSettings)
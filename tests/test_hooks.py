@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from typing import Annotated
+
+import pytest
+
+from envotate import envotate
+from envotate.errors import VariableError
+from envotate.hooks import Collector, Event
+from envotate.types import Function, Regex
+
+
+def slow(value: str) -> str:
+    time.sleep(0.02)
+    return value
+
+
+class Section:
+    SECTION_PORT: int = 1
+
+
+def test_collector_records_events(monkeypatch, export_to_module):
+    monkeypatch.setenv("APP_ENV", "dev")
+    export_to_module(slow, module=__name__)
+    export_to_module(Section, module=__name__)
+    collector = Collector()
+
+    @envotate(hook=collector)
+    class Settings:
+        APP_ENV: Annotated[str, Regex(r"^dev$"), Function(slow)]
+        DEBUG: bool = False
+        SECTION: Section
+
+    section = f"{Settings.__qualname__}.SECTION_PORT"
+    kinds = [(event.kind, event.path, event.arg) for event in collector.events]
+    assert kinds == [
+        ("lookup", "APP_ENV", None),
+        ("apply", "APP_ENV", "Regex"),
+        ("apply", "APP_ENV", "Function"),
+        ("cast", "APP_ENV", None),
+        ("attribute", "APP_ENV", None),
+        ("lookup", "DEBUG", None),
+        ("cast", "DEBUG", None),
+        ("attribute", "DEBUG", None),
+        ("lookup", section, None),
+        ("cast", section, None),
+        ("attribute", section, None),
+        ("section", "SECTION", "Section"),
+    ]
+    assert all(isinstance(event, Event) for event in collector.events)
+
+    slowest = collector.slowest()
+    assert slowest[0].path == "APP_ENV"
+    assert slowest[0].duration >= 0.02
+    assert collector.slowest("apply", limit=1)[0].arg == "Function"
+
+    summary = collector.summary(limit=1)
+    assert summary.splitlines()[0] == "Slowest attributes:"
+    assert "APP_ENV [APP_ENV] Function" in summary
+
+
+def test_hook_receives_failed_events(monkeypatch):
+    monkeypatch.setenv("APP_ENV", "prod")
+    events = []
+
+    with pytest.raises(VariableError):
+
+        @envotate(hook=events.append)
+        class Settings:
+            APP_ENV: Annotated[str, Regex(r"^dev$")]
+
+    assert [event.kind for event in events] == ["lookup", "apply", "attribute"]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+import pytest
+
+from envotate import envotate
+from envotate.errors import VariableError
+from envotate.profiles import Profiles
+from envotate.types import Function, Method
+
+
+def test_profile_overlays_inherit_resolved_values(export_to_module):
+    calls = []
+
+    def fetch(value: str) -> str:
+        calls.append(value)
+        return value.upper()
+
+    export_to_module(fetch, module=__name__)
+    environ = {
+        "APP_PROFILE": "prod",
+        "APP_SECRET": "secret",
+        "APP_HOST": "example.com",
+        "APP_WORKERS": "8",
+    }
+
+    @envotate(prefix="APP", environ=environ)
+    class BaseSettings:
+        SECRET: Annotated[str, Function(fetch)]
+        HOST: str = "localhost"
+        DEBUG: bool = True
+        WORKERS: int = 1
+        URL: Annotated[str, Method("make_url")] = ""
+
+        @classmethod
+        def make_url(cls) -> str:
+            return f"https://{cls.HOST}/{int(cls.DEBUG)}"
+
+    export_to_module(BaseSettings)
+    profiles = Profiles(BaseSettings, "APP_PROFILE")
+
+    @profiles.register("prod")
+    class ProdSettings(BaseSettings):
+        DEBUG: bool = False
+
+    @profiles.register("staging", prefix="STAGING")
+    class StagingSettings(BaseSettings):
+        pass
+
+    assert "SECRET" not in vars(ProdSettings)
+    assert calls == ["secret"]
+
+    assert profiles.select() is ProdSettings
+    assert profiles.active == "prod"
+    # Only the attributes that the profile overrides (or that read it) are resolved.
+    assert calls == ["secret"]
+    assert vars(ProdSettings)["SECRET"] is BaseSettings.SECRET
+    assert ProdSettings.DEBUG is False
+    assert ProdSettings.WORKERS == 8
+    assert ProdSettings.URL == "https://example.com/0"
+    assert BaseSettings.URL == "https://example.com/1"
+    assert "__envotations__" not in vars(StagingSettings)
+
+    # An attribute whose variable has changed since the base resolved it is resolved.
+    environ = {**environ, "APP_PROFILE": "prod", "APP_WORKERS": "16"}
+
+    @envotate(prefix="APP", environ=environ)
+    class LargeSettings(BaseSettings):
+        pass
+
+    assert LargeSettings.WORKERS == 16
+    assert LargeSettings.DEBUG is True
+    assert calls == ["secret"]
+
+    assert profiles.select({}) is BaseSettings
+    assert profiles.active is None
+    with pytest.raises(VariableError, match=r"one of \['prod', 'staging'\]"):
+        profiles.select({"APP_PROFILE": "dev"})
+
+    with pytest.raises(TypeError):
+        Profiles(type("Undecorated", (), {}), "APP_PROFILE")
+    with pytest.raises(TypeError):
+        profiles.register("other")(type("Other", (), {}))
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from envotate import envotate, origin, reload, sources
+from envotate.sources import (
+    Dotenv,
+    Environ,
+    Layered,
+    Secrets,
+    Source,
+    parse_dotenv,
+    read_dotenv,
+)
+
+DOTENV = r"""
+# A comment
+APP_ID=1
+export APP_ENV = staging
+EMPTY=
+UNQUOTED=value # an inline comment
+HASH=value#not-a-comment
+SINGLE='literal \n $value' # comment
+DOUBLE="line\none \"quoted\""
+MULTILINE="first
+  second"
+SPACES="  padded  "
+malformed line
+"""
+
+
+def test_parse_dotenv():
+    assert dict(parse_dotenv(DOTENV.splitlines())) == {
+        "APP_ID": "1",
+        "APP_ENV": "staging",
+        "EMPTY": "",
+        "UNQUOTED": "value",
+        "HASH": "value#not-a-comment",
+        "SINGLE": r"literal \n $value",
+        "DOUBLE": 'line\none "quoted"',
+        "MULTILINE": "first\n  second",
+        "SPACES": "  padded  ",
+    }
+
+    # Only the key of an unterminated value is skipped.
+    lines = ['UNTERMINATED="value', "NEXT=1", "ESCAPED=\\", "SINGLE='a", "LAST=2"]
+    assert dict(parse_dotenv(lines)) == {"NEXT": "1", "ESCAPED": "\\", "LAST": "2"}
+    # A malformed quoted line is skipped without consuming the lines after it.
+    lines = ['A="quoted" trailing', "B=1", "E='it''s'", "C=2"]
+    assert dict(parse_dotenv(lines)) == {"B": "1", "C": "2"}
+
+
+def test_parse_dotenv_with_stray_quote():
+    # Each line is scanned once for the closing quote, so this takes linear time.
+    lines = ['STRAY="value', *(f"KEY_{i}=value" for i in range(50_000))]
+    variables = dict(parse_dotenv(lines))
+    assert len(variables) == 50_000
+    assert "STRAY" not in variables
+
+
+@pytest.mark.parametrize("threshold", [sources.MMAP_THRESHOLD, 0])
+def test_read_dotenv_is_cached_by_file_signature(monkeypatch, tmp_path, threshold):
+    monkeypatch.setattr(sources, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / ".env"
+    path.write_text("APP_ID=1\r\nAPP_ENV='dev'\n")
+
+    variables = read_dotenv(path)
+    assert variables == {"APP_ID": "1", "APP_ENV": "dev"}
+    assert read_dotenv(str(path)) is variables
+
+    with pytest.raises(TypeError):
+        variables["APP_ID"] = "2"
+
+    path.write_text("APP_ID=2\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert read_dotenv(path) == {"APP_ID": "2"}
+
+
+def test_resolve_from_dotenv(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("APP_ID=3\nDEBUG=yes\n")
+
+    @envotate(environ=read_dotenv(path))
+    class DotEnvSettings:
+        APP_ID: int
+        DEBUG: bool
+
+    assert DotEnvSettings.APP_ID == 3
+    assert DotEnvSettings.DEBUG is True
+
+
+def test_resolve_from_layered_sources(monkeypatch, tmp_path):
+    monkeypatch.setenv("APP_ID", "1")
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("APP_ID=2\nAPP_ENV=staging\nDEBUG=no\n")
+    secrets = tmp_path / "secrets"
+    secrets.mkdir()
+    (secrets / "DB_PASSWORD").write_text("secret\n")
+    (secrets / ".hidden").write_text("ignored")
+
+    environ = Layered(
+        [Environ(), Dotenv(dotenv), Dotenv(tmp_path / "missing"), Secrets(secrets)]
+    )
+    assert environ["APP_ID"] == "1"
+    assert environ["DB_PASSWORD"] == "secret"
+    assert ".hidden" not in environ
+    assert environ.origin("APP_ENV") == f"dotenv:{dotenv}"
+
+    @envotate(environ=environ)
+    class LayeredSettings:
+        APP_ID: int
+        APP_ENV: str
+        DEBUG: bool = True
+        DB_PASSWORD: str
+        DB_NAME: str = "local"
+
+    assert LayeredSettings.APP_ID == 1
+    assert LayeredSettings.APP_ENV == "staging"
+    assert LayeredSettings.DEBUG is False
+    assert LayeredSettings.DB_PASSWORD == "secret"
+    assert origin(LayeredSettings, "APP_ID") == "environ"
+    assert origin(LayeredSettings, "APP_ENV") == f"dotenv:{dotenv}"
+    assert origin(LayeredSettings, "DB_PASSWORD") == f"secrets:{secrets}"
+    assert origin(LayeredSettings, "DB_NAME") is None
+
+    # Reloading loads the sources again.
+    monkeypatch.delenv("APP_ID")
+    assert reload(LayeredSettings) == {"APP_ID": (1, 2)}
+    assert origin(LayeredSettings, "APP_ID") == f"dotenv:{dotenv}"
+
+    with pytest.raises(FileNotFoundError):
+        Layered([Dotenv(tmp_path / "missing", required=True)])
+    with pytest.raises(FileNotFoundError):
+        Layered([Secrets(tmp_path / "missing", required=True)])
+
+
+def test_source_requires_load():
+    class Unloaded(Source):
+        @property
+        def name(self) -> str:
+            return "unloaded"
+
+    with pytest.raises(TypeError, match="load"):
+        Unloaded()
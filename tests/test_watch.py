@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from envotate import envotate
+from envotate.sources import Dotenv, Layered, Secrets
+from envotate.watch import Watcher
+
+
+def touch(path, text):
+    stat = path.stat() if path.exists() else None
+    path.write_text(text)
+    if stat is not None:
+        # Ensure the modification time changes on filesystems with a coarse clock.
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+
+def test_watcher_reloads_changed_files(tmp_path):
+    dotenv = tmp_path / ".env"
+    dotenv.write_text("APP_ID=1\nDEBUG=no\n")
+    secrets = tmp_path / "secrets"
+    secrets.mkdir()
+
+    @envotate(environ=Layered([Dotenv(dotenv), Secrets(secrets)]))
+    class WatchedSettings:
+        APP_ID: int
+        DEBUG: bool
+        DB_PASSWORD: str = ""
+
+    watcher = Watcher(WatchedSettings, debounce=60)
+    received = []
+    watcher.subscribe(received.append)
+    assert watcher.paths == [str(dotenv), str(secrets)]
+    assert watcher.poll() == {}
+
+    touch(dotenv, "APP_ID=2\nDEBUG=no\n")
+    # The change is only applied once the files have settled.
+    assert watcher.poll() == {}
+    assert WatchedSettings.APP_ID == 1
+
+    watcher.debounce = 0
+    assert watcher.poll() == {"APP_ID": (1, 2)}
+    assert watcher.poll() == {}
+    assert WatchedSettings.APP_ID == 2
+
+    (secrets / "DB_PASSWORD").write_text("secret")
+    assert watcher.poll() == {"DB_PASSWORD": ("", "secret")}
+    assert received == [{"APP_ID": (1, 2)}, {"DB_PASSWORD": ("", "secret")}]
+
+    # An invalid value is logged and the class is left unchanged.
+    touch(dotenv, "APP_ID=invalid\n")
+    assert watcher.poll() == {}
+    assert WatchedSettings.APP_ID == 2
+
+    with pytest.raises(TypeError):
+        Watcher(type("Undecorated", (), {}))
+
+
+def test_watcher_retries_failed_reload(tmp_path):
+    path = tmp_path / "trigger"
+    path.write_text("")
+
+    @envotate(environ={"APP_ID": "1"})
+    class RetrySettings:
+        APP_ID: int
+
+    attempts = []
+
+    def environ():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise OSError("The environment is unavailable.")
+        return {"APP_ID": "2"}
+
+    watcher = Watcher(RetrySettings, [path], debounce=0, environ=environ)
+    touch(path, "changed")
+    assert watcher.poll() == {}
+    assert RetrySettings.APP_ID == 1
+    # The change is retried at the normal interval without the files changing again.
+    assert watcher.poll_interval() == watcher.interval
+    assert watcher.poll() == {"APP_ID": (1, 2)}
+    assert watcher.poll() == {}
+    assert attempts == [0, 1]
+
+
+def test_watcher_polls_in_background(tmp_path):
+    path = tmp_path / ".env"
+    path.write_text("APP_ID=1\n")
+
+    @envotate(environ=Layered([Dotenv(path)]))
+    class BackgroundSettings:
+        APP_ID: int
+
+    changed = threading.Event()
+    with Watcher(BackgroundSettings, interval=0.01, debounce=0.01) as watcher:
+        watcher.subscribe(lambda changes: changed.set())
+        touch(path, "APP_ID=2\n")
+        assert changed.wait(5)
+    assert watcher.thread is None
+    assert BackgroundSettings.APP_ID == 2
+
+    async def main():
+        watcher = Watcher(BackgroundSettings, interval=0.01, debounce=0)
+        task = asyncio.create_task(watcher.arun())
+        touch(path, "APP_ID=3\n")
+        while BackgroundSettings.APP_ID != 3:
+            await asyncio.sleep(0.01)
+        watcher.stop()
+        await asyncio.wait_for(task, 5)
+
+    asyncio.run(main())